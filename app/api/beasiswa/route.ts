@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server'
+import { gunzipSync } from 'zlib'
 import { BeasiswaModel } from '@/services/database/models'
 
 // Sample data sebagai fallback
@@ -60,6 +61,29 @@ const sampleData = [
   }
 ]
 
+// Read a JSON body; the scraper gzip-compresses uploads (Content-Encoding: gzip)
+async function readJsonBody(request: NextRequest) {
+  if (request.headers.get('content-encoding') !== 'gzip') {
+    return request.json()
+  }
+  const compressed = Buffer.from(await request.arrayBuffer())
+  return JSON.parse(gunzipSync(compressed).toString('utf-8'))
+}
+
+// Transform one record from scraper format to database format
+function toDatabaseFormat(item: any) {
+  return {
+    judul: item.nama_beasiswa || item.judul || 'Unknown',
+    deskripsi: item.deskripsi || item.persyaratan || '',
+    deadline: item.deadline || '',
+    link: item.link_pendaftaran || item.link || '',
+    kategori: item.kategori || '',
+    sumber: item.website_sumber || item.sumber || '',
+    record_key: item.record_key || null,
+    content_hash: item.content_hash || null
+  }
+}
+
 export async function GET(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url)
@@ -119,7 +143,7 @@ export async function GET(request: NextRequest) {
 
 export async function POST(request: NextRequest) {
   try {
-    const body = await request.json()
+    const body = await readJsonBody(request)
     const { beasiswaList, clearFirst = false } = body
 
     if (!Array.isArray(beasiswaList)) {
@@ -130,14 +154,7 @@ export async function POST(request: NextRequest) {
     }
 
     // Transform data from scraper format to database format
-    const transformedData = beasiswaList.map(item => ({
-      judul: item.nama_beasiswa || item.judul || 'Unknown',
-      deskripsi: item.deskripsi || item.persyaratan || '',
-      deadline: item.deadline || '',
-      link: item.link_pendaftaran || item.link || '',
-      kategori: item.kategori || '',
-      sumber: item.website_sumber || item.sumber || ''
-    }))
+    const transformedData = beasiswaList.map(toDatabaseFormat)
 
     // Clear database first if requested
     if (clearFirst) {
@@ -165,6 +182,55 @@ export async function POST(request: NextRequest) {
   }
 }
 
+// Delta sync: only new, changed and removed records, applied in one transaction
+export async function PATCH(request: NextRequest) {
+  try {
+    const body = await readJsonBody(request)
+    const { inserts = [], updates = [], deletes = [], replace = false, keep = [] } = body
+
+    if (!Array.isArray(inserts) || !Array.isArray(updates) || !Array.isArray(deletes) || !Array.isArray(keep)) {
+      return NextResponse.json({
+        success: false,
+        error: 'Invalid data format. Expected inserts, updates, deletes and keep arrays.'
+      }, { status: 400 })
+    }
+
+    const keyed = [...inserts, ...updates].every(item => item && item.record_key)
+    const keysOnly = [...deletes, ...keep].every(key => typeof key === 'string')
+    if (!keyed || !keysOnly) {
+      return NextResponse.json({
+        success: false,
+        error: 'Invalid data format. Every record needs a record_key, deletes and keep must be record keys.'
+      }, { status: 400 })
+    }
+
+    const result = await BeasiswaModel.applyDelta({
+      inserts: inserts.map(toDatabaseFormat),
+      updates: updates.map(toDatabaseFormat),
+      deletes,
+      replace: Boolean(replace),
+      keep
+    })
+
+    console.log('Successfully synced beasiswa data', { ...result, replace: Boolean(replace) })
+
+    return NextResponse.json({
+      success: true,
+      message: `Synced beasiswa records: ${result.inserted} inserted, ${result.updated} updated, ${result.deleted} deleted${replace ? ' (table replaced)' : ''}`,
+      ...result,
+      timestamp: new Date().toISOString()
+    })
+  } catch (error) {
+    console.error('Failed to sync beasiswa data:', error instanceof Error ? error.message : String(error))
+
+    return NextResponse.json({
+      success: false,
+      error: 'Failed to sync beasiswa data',
+      message: error instanceof Error ? error.message : 'Unknown error occurred'
+    }, { status: 500 })
+  }
+}
+
 export async function DELETE(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark ukuran file dan waktu muat snapshot Parquet dibandingkan ekspor JSON dan CSV
+Ketiga file ditulis dengan sink pipeline yang sama dari record sintetis (BENCH_ROWS, default 50000),
+lalu dimuat penuh dan dimuat dua kolom saja (kategori, deadline) seperti job analitik
+"""
+
+import csv
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from utils.columnar import ParquetSink, parquet_available, pq
+from utils.pipeline import CsvSink, JsonArraySink, Pipeline
+from utils.records import Scholarship
+
+RUNS = int(os.getenv('BENCH_RUNS', '3'))
+ROWS = int(os.getenv('BENCH_ROWS', '50000'))
+COLUMNS = ['kategori', 'deadline']
+
+
+def records(rows):
+    """Record sintetis dengan panjang teks mirip hasil scraping"""
+    categories = ['SD-SMP-SMA Domestik', 'SMP-SMA Internasional/Pertukaran',
+                  'Perguruan Tinggi Dalam Negeri', 'Perguruan Tinggi Luar Negeri']
+    for index in range(rows):
+        yield Scholarship(
+            f"Beasiswa Contoh {index}", categories[index % 4], f"https://contoh{index % 50}.ac.id",
+            'Deskripsi beasiswa untuk mahasiswa berprestasi. ' * 8, 'IPK minimal 3.0, aktif kuliah',
+            'Lihat website resmi', f"https://contoh{index % 50}.ac.id/daftar", '2024-01-01 00:00:00'
+        )
+
+
+def load_json(path, columns=None):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [{column: item[column] for column in columns} for item in data] if columns else data
+
+
+def load_csv(path, columns=None):
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    return [{column: row[column] for column in columns} for row in rows] if columns else rows
+
+
+def load_parquet(path, columns=None):
+    return pq.read_table(path, columns=columns, memory_map=True)
+
+
+def median_time(load, path, columns=None):
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        load(path, columns)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    if not parquet_available():
+        print("[WARNING] pyarrow tidak tersedia, benchmark Parquet tidak bisa dijalankan")
+        return
+
+    print(f"Benchmark snapshot kolumnar: {ROWS} records, {RUNS} run\n")
+    with tempfile.TemporaryDirectory() as directory:
+        sinks = [
+            JsonArraySink('bench.json', directory=directory),
+            CsvSink('bench.csv', directory=directory),
+            ParquetSink('bench.parquet', directory=directory),
+        ]
+        with Pipeline(sinks) as pipeline:
+            pipeline.write_all(records(ROWS))
+
+        formats = [('json', load_json), ('csv', load_csv), ('parquet', load_parquet)]
+        print(f"{'format':<8} {'ukuran (KB)':>12} {'muat penuh (s)':>15} {'muat 2 kolom (s)':>17}")
+        for name, load in formats:
+            path = os.path.join(directory, f'bench.{name}')
+            size = os.path.getsize(path) / 1024
+            full = median_time(load, path)
+            partial = median_time(load, path, COLUMNS)
+            print(f"{name:<8} {size:>12.0f} {full:>15.3f} {partial:>17.3f}")
+
+
+if __name__ == '__main__':
+    main()
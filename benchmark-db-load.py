@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark memuat record beasiswa ke database: COPY langsung ke PostgreSQL (PostgresSink)
+dibandingkan upload lewat API HTTP (BulkUploader, POST /api/beasiswa)
+Record diambil dari data/beasiswa_semua.jsonl (hasil run sebelumnya) dan digandakan sampai BENCH_RECORDS
+
+BENCH_DATABASE_URL  PostgreSQL lokal untuk diuji; dimuat ke tabel BENCH_TABLE (default beasiswa_bench)
+BENCH_API_URL       URL API untuk diuji, misal http://localhost:3000 (ISI TABEL API AKAN DIGANTI)
+"""
+
+import json
+import os
+import statistics
+import time
+
+from utils.bulk_upload import BulkUploader
+from utils.pg_loader import PostgresSink, psycopg2
+from utils.records import Scholarship, ScholarshipBatch
+
+RUNS = int(os.getenv('BENCH_RUNS', '3'))
+RECORDS = int(os.getenv('BENCH_RECORDS', '5000'))
+TABLE = os.getenv('BENCH_TABLE', 'beasiswa_bench')
+
+
+def load_records(path='data/beasiswa_semua.jsonl'):
+    """Record hasil run sebelumnya (atau record contoh), digandakan dengan nama unik sampai RECORDS"""
+    samples = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            samples = [Scholarship.from_dict(json.loads(line)) for line in f if line.strip()]
+    except OSError:
+        pass
+    if not samples:
+        samples = [Scholarship('Beasiswa Contoh', 'Beasiswa Domestik', 'https://contoh.ac.id',
+                               'Deskripsi beasiswa contoh ' * 10, 'Persyaratan umum', 'Lihat website',
+                               'https://contoh.ac.id', '2024-01-01')]
+
+    batch = ScholarshipBatch()
+    for index in range(RECORDS):
+        record = samples[index % len(samples)]
+        batch.append(Scholarship(f"{record.nama_beasiswa} #{index}", *record.values()[1:]))
+    return batch
+
+
+def bench_postgres(batch):
+    """Waktu memuat batch lewat COPY + merge, lalu cek jumlah baris di tabel"""
+    timings = []
+    for _ in range(RUNS):
+        sink = PostgresSink(os.getenv('BENCH_DATABASE_URL'), table=TABLE)
+        start = time.perf_counter()
+        sink.open()
+        for record in batch:
+            sink.write(record)
+        if not sink.close():
+            print("[ERROR] PostgresSink gagal")
+            return None
+        timings.append(time.perf_counter() - start)
+
+    conn = psycopg2.connect(os.getenv('BENCH_DATABASE_URL'))
+    with conn.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*), COUNT(DISTINCT record_key) FROM {TABLE}")
+        rows, keys = cursor.fetchone()
+    conn.close()
+    status = 'OK' if rows == keys == len(batch) else 'TIDAK SESUAI'
+    print(f"[INFO] Tabel {TABLE}: {rows} baris, {keys} record_key unik ({status})")
+    return timings
+
+
+def bench_http(batch):
+    """Waktu upload batch lewat API HTTP dengan chunk gzip paralel"""
+    uploader = BulkUploader.from_env(f"{os.getenv('BENCH_API_URL')}/api/beasiswa")
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        if not uploader.upload(batch, clear_first=True):
+            print("[ERROR] Upload HTTP gagal")
+            return None
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name, timings, count):
+    if not timings:
+        return
+    median = statistics.median(timings)
+    print(f"{name:<12} median {median:8.3f} detik  {count / median:10.0f} records/s")
+
+
+def main():
+    batch = load_records()
+    print(f"Benchmark load database: {len(batch)} records, {RUNS} run\n")
+
+    results = []
+    if not os.getenv('BENCH_DATABASE_URL'):
+        print("[WARNING] BENCH_DATABASE_URL belum diset, lewati COPY PostgreSQL")
+    elif psycopg2 is None:
+        print("[WARNING] psycopg2 tidak tersedia, lewati COPY PostgreSQL")
+    else:
+        results.append(('postgres', bench_postgres(batch)))
+
+    if not os.getenv('BENCH_API_URL'):
+        print("[WARNING] BENCH_API_URL belum diset, lewati upload HTTP")
+    else:
+        results.append(('http', bench_http(batch)))
+
+    print()
+    for name, timings in results:
+        report(name, timings, len(batch))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark ekspor Excel: XlsxWriter streaming (tanpa pandas) dibandingkan pandas DataFrame.to_excel
+Setiap writer dijalankan di proses terpisah agar peak RSS tidak saling mempengaruhi
+Jumlah baris diatur lewat BENCH_ROWS (default 50000)
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from utils.records import Scholarship, ScholarshipBatch
+from utils.xlsx_writer import XlsxWriter
+
+ROWS = int(os.getenv('BENCH_ROWS', '50000'))
+
+
+def build_batch(rows):
+    """Batch record sintetis dengan panjang teks mirip hasil scraping"""
+    batch = ScholarshipBatch()
+    for index in range(rows):
+        batch.append(Scholarship(
+            f"Beasiswa Contoh {index}", 'Beasiswa Domestik', f"https://contoh{index % 50}.ac.id",
+            'Deskripsi beasiswa untuk mahasiswa berprestasi. ' * 8, 'IPK minimal 3.0, aktif kuliah',
+            'Lihat website resmi', f"https://contoh{index % 50}.ac.id/daftar", '2024-01-01 00:00:00'
+        ))
+    return batch
+
+
+def write_native(batch, path):
+    with XlsxWriter(path) as writer:
+        writer.write_row(list(batch.columns), bold=True)
+        for row in batch.rows():
+            writer.write_row(row)
+
+
+def write_pandas(batch, path):
+    import pandas as pd
+    pd.DataFrame(batch.columns).to_excel(path, index=False)
+
+
+def peak_rss_mb():
+    # ru_maxrss dalam KB di Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_child(mode):
+    """Dijalankan di proses anak: tulis file lalu cetak waktu, peak RSS, tambahan RSS dan ukuran file"""
+    batch = build_batch(ROWS)
+    writer = write_native if mode == 'native' else write_pandas
+    if mode == 'pandas':
+        import pandas  # noqa: F401 - biaya import tidak dihitung sebagai memori writer
+    baseline = peak_rss_mb()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.xlsx')
+        start = time.perf_counter()
+        writer(batch, path)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path)
+    peak = peak_rss_mb()
+    print(f"{elapsed:.3f} {peak:.1f} {peak - baseline:.1f} {size}")
+
+
+def main():
+    print(f"Benchmark ekspor Excel: {ROWS} baris\n")
+    print(f"{'writer':<8} {'waktu (s)':>10} {'peak RSS (MB)':>14} {'+RSS tulis (MB)':>16} {'ukuran (KB)':>12}")
+
+    for mode in ('native', 'pandas'):
+        result = subprocess.run([sys.executable, __file__, '--child', mode], capture_output=True, text=True)
+        if result.returncode != 0:
+            reason = 'pandas/openpyxl tidak tersedia' if 'ModuleNotFoundError' in result.stderr else result.stderr.strip()[-200:]
+            print(f"{mode:<8} dilewati: {reason}")
+            continue
+        elapsed, peak, extra, size = result.stdout.split()
+        print(f"{mode:<8} {float(elapsed):>10.3f} {float(peak):>14.1f} {float(extra):>16.1f} {int(size) / 1024:>12.0f}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == '--child':
+        run_child(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark waktu parse dan memori puncak per backend parser (html.parser, lxml, selectolax),
+baik parse penuh maupun parse parsial yang hanya membangun tag yang dibutuhkan scraper
+Halaman diambil dari page store (data/page_store) hasil scraping sebelumnya,
+atau dari file HTML yang diberikan sebagai argumen
+"""
+
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+import zlib
+
+from utils.helpers import WebScraperHelper
+from utils.page_store import PageStore
+from utils.parsers import BACKENDS, PREFERRED_BACKENDS, available_backends, get_parser_backend
+
+RUNS = int(os.getenv('BENCH_RUNS', '5'))
+
+# Tag yang dibaca scraper (PAGE_NEEDS)
+ONLY = ('h1', 'p')
+
+
+def load_pages(paths):
+    """Muat HTML dari file argumen, atau semua blob di page store"""
+    pages = []
+    if paths:
+        for path in paths:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                pages.append((path, f.read()))
+        return pages
+
+    store = PageStore.from_env()
+    for url, entry in store._entries.items():
+        try:
+            with open(store._blob_path(entry['hash']), 'rb') as f:
+                pages.append((url, zlib.decompress(f.read()).decode('utf-8')))
+        except (OSError, zlib.error, UnicodeDecodeError):
+            continue
+    return pages
+
+
+def extract_sample(helper, soup):
+    """Ekstraksi yang sama dengan scraper: judul h1 dan paragraf pertama"""
+    return helper.extract_text(soup.find('h1')), helper.extract_text(soup.find('p'))
+
+
+def measure(backend, pages, helper, only=None):
+    """Total waktu parse + ekstraksi semua halaman (diulang RUNS kali) dan memori puncak per halaman"""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        for _, html in pages:
+            extract_sample(helper, backend.parse(html, only=only))
+        timings.append(time.perf_counter() - start)
+
+    peak = 0
+    for _, html in pages:
+        tracemalloc.start()
+        soup = backend.parse(html, only=only)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del soup
+    return timings, peak
+
+
+def check_auto_partial(helper):
+    """Pastikan backend auto benar-benar parse parsial saat scraper hanya butuh ONLY"""
+    html = '<html><body><div class="nav"><a href="/">Beranda</a></div><h1>Judul</h1><p>Isi</p></body></html>'
+    backend = get_parser_backend('auto', partial=True)
+    soup = helper.parse_html(html, backend='auto', only=ONLY)
+    if soup.find('div') is None and soup.find('a') is None:
+        print(f"✅ Parse parsial auto memakai {backend.name}")
+    else:
+        print(f"[WARNING] Backend auto ({backend.name}) tidak parse parsial, tag di luar {ONLY} ikut dibangun")
+
+
+def run_benchmark(paths):
+    print("⏱️ Benchmark Backend Parser HTML")
+    print("===============================")
+
+    pages = load_pages(paths)
+    if not pages:
+        print("❌ Tidak ada halaman. Jalankan main_scraper.py dulu atau berikan file HTML sebagai argumen")
+        return
+
+    total_kb = sum(len(html) for _, html in pages) / 1024
+    print(f"Halaman: {len(pages)} ({total_kb:.0f} KB), percobaan: {RUNS}")
+
+    missing = [name for name in PREFERRED_BACKENDS if name not in available_backends()]
+    if missing:
+        print(f"[WARNING] Backend tidak terpasang: {', '.join(missing)}")
+
+    helper = WebScraperHelper()
+    check_auto_partial(helper)
+    results = {}
+    baseline = None
+    for name in available_backends():
+        backend = BACKENDS[name]
+        timings, peak = measure(backend, pages, helper)
+        results[name] = statistics.median(timings)
+        print(f"• {name}: median {results[name] * 1000:.2f} ms "
+              f"({results[name] * 1000 / len(pages):.2f} ms/halaman, puncak {peak / 1024:.0f} KB)")
+
+        if backend.supports_only:
+            timings, peak = measure(backend, pages, helper, only=ONLY)
+            print(f"  parsial {ONLY}: median {statistics.median(timings) * 1000:.2f} ms "
+                  f"(puncak {peak / 1024:.0f} KB)")
+
+        # Pastikan ekstraksi (termasuk parse parsial) menghasilkan teks yang sama dengan html.parser
+        extracted = [extract_sample(helper, backend.parse(html, only=ONLY)) for _, html in pages]
+        if name == 'html.parser':
+            continue
+        baseline = baseline or [extract_sample(helper, BACKENDS['html.parser'].parse(html)) for _, html in pages]
+        mismatches = sum(1 for a, b in zip(extracted, baseline) if a != b)
+        if mismatches:
+            print(f"  [WARNING] {mismatches} halaman menghasilkan teks berbeda dari html.parser")
+
+    if 'html.parser' in results:
+        fastest = min(results, key=results.get)
+        if results[fastest] > 0 and fastest != 'html.parser':
+            print(f"\n🚀 {fastest} {results['html.parser'] / results[fastest]:.1f}x lebih cepat dari html.parser")
+
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1:])
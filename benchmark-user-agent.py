@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark waktu startup User-Agent: fake_useragent vs pool bundel utils.user_agents
+Setiap percobaan dijalankan di proses Python baru agar biaya import ikut terukur
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = int(os.getenv('BENCH_RUNS', '5'))
+
+# Empat helper per run (satu per kategori), sama seperti main_scraper sebelumnya
+FAKE_USERAGENT_SNIPPET = """
+import time
+start = time.perf_counter()
+from fake_useragent import UserAgent
+agents = [UserAgent().random for _ in range(4)]
+print(time.perf_counter() - start)
+"""
+
+BUNDLED_POOL_SNIPPET = """
+import time
+start = time.perf_counter()
+from utils.user_agents import random_user_agent, user_agent_for
+agents = [random_user_agent() for _ in range(4)] + [user_agent_for('https://www.chevening.org/')]
+print(time.perf_counter() - start)
+"""
+
+
+def measure(snippet):
+    """Jalankan snippet di proses baru sebanyak RUNS kali, kembalikan daftar durasi (detik)"""
+    timings = []
+    for _ in range(RUNS):
+        result = subprocess.run(
+            [sys.executable, '-c', snippet],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        if result.returncode != 0:
+            print(f"❌ Gagal menjalankan benchmark: {result.stderr.strip()}")
+            return None
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def run_benchmark():
+    print("⏱️ Benchmark Startup User-Agent")
+    print("==============================")
+    print(f"Jumlah percobaan: {RUNS}")
+
+    results = {}
+    for name, snippet in (('fake_useragent', FAKE_USERAGENT_SNIPPET), ('pool bundel', BUNDLED_POOL_SNIPPET)):
+        timings = measure(snippet)
+        if timings:
+            results[name] = statistics.median(timings)
+            print(f"• {name}: median {results[name] * 1000:.2f} ms "
+                  f"(min {min(timings) * 1000:.2f} ms, max {max(timings) * 1000:.2f} ms)")
+
+    if len(results) == 2 and results['pool bundel'] > 0:
+        print(f"\n🚀 Pool bundel {results['fake_useragent'] / results['pool bundel']:.0f}x lebih cepat")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -25,10 +25,16 @@ async function initDatabase() {
         link TEXT,
         kategori VARCHAR(100),
         sumber VARCHAR(100),
+        record_key VARCHAR(64),
+        content_hash VARCHAR(64),
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
       )
     `)
+    // Tabel lama dibuat sebelum ada record_key/content_hash (dipakai sinkronisasi delta dan upsert)
+    await client.query('ALTER TABLE beasiswa ADD COLUMN IF NOT EXISTS record_key VARCHAR(64)')
+    await client.query('ALTER TABLE beasiswa ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)')
+    await client.query('CREATE UNIQUE INDEX IF NOT EXISTS beasiswa_record_key_idx ON beasiswa (record_key)')
     console.log('✅ Beasiswa table created/verified')
     
     // Create scheduler_status table
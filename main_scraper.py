@@ -7,9 +7,9 @@ Main script untuk menjalankan semua scraper beasiswa
 
 import sys
 import os
-import time
 import json
-import requests
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Import semua scraper
@@ -17,156 +17,278 @@ from scrapers.domestik_scraper import DomestikScholarshipScraper
 from scrapers.internasional_scraper import InternasionalScholarshipScraper
 from scrapers.universitas_dalam_negeri import UniversitasDalamNegeriScraper
 from scrapers.universitas_luar_negeri import UniversitasLuarNegeriScraper
+from scrapers.engine import ScrapeEngine
+from utils.bulk_upload import BulkUploader
+from utils.columnar import ParquetSink, parquet_available
 from utils.helpers import WebScraperHelper
+from utils.pg_loader import PostgresSink
+from utils.pipeline import (
+    ChangesSink, CsvSink, DatabaseSink, DeltaSink, ExcelSink, JsonArraySink, JsonLinesSink, Pipeline,
+    buffered,
+)
+from utils.fingerprints import GONE
+from utils.records import Scholarship
+from utils.run_memo import reset_run_memo
+from utils.settings import env_int
+from utils.sync_snapshot import SyncSnapshot
 
-def clear_database():
-    """Clear semua data beasiswa dari database"""
+def save_to_database(beasiswa_list, clear_first=True):
+    """Menyimpan data beasiswa ke database melalui API dengan pendekatan delete-insert
+
+    Record dikirim dalam chunk berbatas ukuran yang dikompres gzip dan diupload paralel.
+    Dengan clear_first=False data hanya ditambahkan (dipakai untuk chunk lanjutan saat streaming).
+    """
     try:
         api_url = os.getenv('VERCEL_URL', 'https://scrapingbeasiswaweb.vercel.app')
         
-        print("[INFO] Clearing database...")
-        
-        response = requests.delete(
-            f'{api_url}/api/beasiswa?action=clear',
-            headers={'Content-Type': 'application/json'},
-            timeout=30
-        )
+        if clear_first:
+            # Tabel dikosongkan oleh API lewat flag clearFirst pada chunk pertama
+            print(f"[INFO] Memulai proses delete-insert untuk {len(beasiswa_list)} records")
+        else:
+            print(f"[INFO] Menambahkan {len(beasiswa_list)} records ke database")
         
-        if response.status_code == 200:
-            result = response.json()
-            if result.get('success'):
-                print("[SUCCESS] Database berhasil di-clear")
-                return True
-            else:
-                print(f"[ERROR] Gagal clear database: {result.get('message', 'Unknown error')}")
-                return False
+        uploader = BulkUploader.from_env(f'{api_url}/api/beasiswa')
+        if uploader.upload(beasiswa_list, clear_first=clear_first):
+            print(f"[SUCCESS] Data berhasil disimpan ke database: {len(beasiswa_list)} records")
+            if clear_first:
+                print(f"[INFO] Database telah di-clear dan di-insert ulang")
+            return True
         else:
-            print(f"[ERROR] HTTP Error {response.status_code}: {response.text}")
+            print("[ERROR] Gagal menyimpan sebagian data ke database")
             return False
             
-    except requests.exceptions.RequestException as e:
-        print(f"[ERROR] Network error saat clear database: {e}")
-        return False
     except Exception as e:
-        print(f"[ERROR] Error saat clear database: {e}")
+        print(f"[ERROR] Error saat menyimpan ke database: {e}")
         return False
 
-def save_to_database(beasiswa_list):
-    """Menyimpan data beasiswa ke database melalui API dengan pendekatan delete-insert"""
+def sync_database(inserts, updates, deletes, replace=False):
+    """Sinkronisasi delta ke database melalui API (PATCH /api/beasiswa)
+
+    Hanya record baru, record berubah dan record_key yang hilang yang dikirim. Delta kecil
+    diterapkan API dalam satu transaksi; delta besar dikirim sebagai chunk upsert paralel
+    dan penghapusan baru dikirim setelah semua chunk berhasil, sehingga tabel tidak pernah
+    kosong. Dengan replace=True semua baris yang tidak ada di run ini dihapus di akhir.
+    """
     try:
         api_url = os.getenv('VERCEL_URL', 'https://scrapingbeasiswaweb.vercel.app')
         
-        print(f"[INFO] Memulai proses delete-insert untuk {len(beasiswa_list)} records")
-        
-        # Clear database terlebih dahulu
-        clear_success = clear_database()
-        if not clear_success:
-            print("[WARNING] Gagal clear database, mencoba dengan flag clearFirst")
-        
-        # Kirim data dengan flag clearFirst=True untuk delete-insert
-        response = requests.post(
-            f'{api_url}/api/beasiswa',
-            json={
-                'beasiswaList': beasiswa_list,
-                'clearFirst': True  # Clear database terlebih dahulu
-            },
-            headers={'Content-Type': 'application/json'},
-            timeout=60  # Increase timeout for delete-insert operation
-        )
+        if replace:
+            print(f"[INFO] Sinkronisasi penuh: {len(inserts)} records menggantikan isi database")
+        else:
+            print(f"[INFO] Sinkronisasi delta: {len(inserts)} baru, {len(updates)} berubah, {len(deletes)} dihapus")
         
-        if response.status_code == 200:
-            result = response.json()
-            if result.get('success'):
-                print(f"[SUCCESS] Data berhasil disimpan ke database: {len(beasiswa_list)} records")
-                print(f"[INFO] Database telah di-clear dan di-insert ulang")
-                return True
-            else:
-                print(f"[ERROR] Gagal menyimpan ke database: {result.get('message', 'Unknown error')}")
-                return False
+        uploader = BulkUploader.from_env(f'{api_url}/api/beasiswa')
+        if uploader.sync(inserts, updates, deletes, replace=replace):
+            print("[SUCCESS] Sinkronisasi database berhasil")
+            return True
         else:
-            print(f"[ERROR] HTTP Error {response.status_code}: {response.text}")
+            print("[ERROR] Gagal sinkronisasi database, sinkronisasi berikutnya mengganti seluruh isi tabel")
             return False
             
-    except requests.exceptions.RequestException as e:
-        print(f"[ERROR] Network error saat menyimpan ke database: {e}")
-        return False
     except Exception as e:
-        print(f"[ERROR] Error saat menyimpan ke database: {e}")
+        print(f"[ERROR] Error saat sinkronisasi database: {e}")
         return False
 
-def main():
+def print_fetch_summary(helper):
+    """Tampilkan ringkasan statistik fetch untuk run ini"""
+    print("\n=== RINGKASAN FETCH ===")
+    
+    throttle_stats = helper.get_throttle_stats()
+    if throttle_stats:
+        print("[INFO] Throttling per host:")
+        for host, stats in sorted(throttle_stats.items()):
+            print(f"  - {host}: {stats['requests']} request, throttled {stats['throttled']:.1f} detik")
+    
+    cache_stats = helper.get_cache_stats()
+    print(f"[INFO] Cache HTTP: {cache_stats['hits']} hit (304), "
+          f"{cache_stats['misses']} miss, {cache_stats['revalidations']} revalidasi")
+    
+    store_stats = helper.get_page_store_stats()
+    print(f"[INFO] Page store: {store_stats['hits']} hit, {store_stats['stale']} kedaluwarsa, "
+          f"{store_stats['misses']} miss, {store_stats['evicted']} dibuang, "
+          f"{store_stats['entries']} halaman ({store_stats['bytes'] / 1024:.0f} KB)")
+    
+    breaker_stats = helper.get_breaker_stats()
+    total_retries = sum(stats['retries'] for stats in breaker_stats.values())
+    open_hosts = [host for host, stats in breaker_stats.items() if stats['state'] == 'open']
+    print(f"[INFO] Retry: {total_retries} percobaan ulang, circuit breaker terbuka: {len(open_hosts)} host")
+    for host in sorted(open_hosts):
+        stats = breaker_stats[host]
+        print(f"  - {host}: {stats['failures']} gagal, {stats['retries']} retry, {stats['rejected']} request dilewati")
+    
+    pool_stats = helper.get_pool_stats()
+    print(f"[INFO] Connection pool: {pool_stats['requests']} request, "
+          f"{pool_stats['opened']} koneksi baru, {pool_stats['reused']} koneksi dipakai ulang")
+    
+    memo_stats = helper.get_memo_stats()
+    print(f"[INFO] Memo run: {memo_stats['urls']} URL unik, {memo_stats['fetch_avoided']} fetch duplikat "
+          f"dan {memo_stats['parse_avoided']} parse duplikat dihindari")
+    
+    parse_stats = helper.get_parse_stats()
+    print(f"[INFO] Pool parsing: {parse_stats['workers']} worker, {parse_stats['pages']} halaman di proses worker, "
+          f"{parse_stats['inline']} di thread")
+    
+    helper.http_cache.save()
+    helper.page_store.save()
+
+# Kategori yang dijalankan: (judul log, label, kelas scraper), urutan ini juga urutan hasil
+CATEGORIES = [
+    ('DOMESTIK', 'domestik', DomestikScholarshipScraper),
+    ('INTERNASIONAL', 'internasional', InternasionalScholarshipScraper),
+    ('PT DALAM NEGERI', 'PT dalam negeri', UniversitasDalamNegeriScraper),
+    ('PT LUAR NEGERI', 'PT luar negeri', UniversitasLuarNegeriScraper),
+]
+
+def print_change_summary(engine):
+    """Tampilkan jumlah sumber baru/berubah/tidak berubah/hilang per kategori"""
+    print("\n=== RINGKASAN PERUBAHAN ===")
+    change_stats = engine.fingerprints.stats()
+    for category in engine.registry.categories:
+        counts = change_stats.get(category)
+        if not counts:
+            continue
+        print(f"[INFO] {engine.registry.category_label(category)}: {counts['new']} baru, "
+              f"{counts['changed']} berubah, {counts['unchanged']} tidak berubah, {counts['gone']} hilang")
+
+def stream_categories(engine, executor=None):
+    """Stream record semua kategori dengan urutan CATEGORIES, hasil berupa list (judul, label, records)
+
+    Dengan executor, setiap kategori berjalan paralel di thread-nya sendiri dan mengisi
+    antrean terbatas (SCRAPER_STREAM_BUFFER); kategori berhenti menunggu jika konsumen
+    tertinggal. Tanpa executor kategori dijalankan berurutan saat dikonsumsi.
+    """
+    streams = []
+    for judul, label, scraper_class in CATEGORIES:
+        records = scraper_class(engine).stream(with_status=True)
+        if executor is not None:
+            records = buffered(records, engine.stream_buffer, executor)
+        streams.append((judul, label, records))
+    return streams
+
+def build_database_sink(keep=()):
+    """Sink database sesuai SCRAPER_DB_SYNC: delta (default), full (delete-insert per chunk lewat API)
+    atau postgres (COPY langsung ke DATABASE_URL); baris milik scope keep tidak dihapus"""
+    mode = os.getenv('SCRAPER_DB_SYNC', 'delta').strip().lower()
+    if mode in ('full', 'postgres'):
+        # Tabel diganti di luar sinkronisasi delta, delta berikutnya harus mengganti seluruh tabel
+        SyncSnapshot.from_env().invalidate()
+    if mode == 'full':
+        return DatabaseSink(save_to_database, batch_size=env_int('SCRAPER_DB_BATCH', 1000))
+    if mode == 'postgres':
+        return PostgresSink.from_env(keep=keep)
+    if mode != 'delta':
+        print(f"[WARNING] SCRAPER_DB_SYNC={mode} tidak dikenal, memakai delta")
+    return DeltaSink(sync_database, SyncSnapshot.from_env(), keep=keep)
+
+# Ekspor yang bisa dipilih lewat --exports / SCRAPER_EXPORTS, urutan ini juga urutan laporan
+EXPORTS = {
+    'jsonl': lambda keep: JsonLinesSink('beasiswa_semua.jsonl'),
+    'changes': lambda keep: ChangesSink('beasiswa_perubahan.jsonl'),
+    'json': lambda keep: JsonArraySink('beasiswa_semua.json'),
+    'csv': lambda keep: CsvSink('beasiswa_semua.csv'),
+    'xlsx': lambda keep: ExcelSink('beasiswa_semua.xlsx'),
+    'parquet': lambda keep: build_parquet_sink(),
+    'database': lambda keep: build_database_sink(keep),
+}
+
+def selected_exports(argv=None):
+    """Nama ekspor dari argumen --exports atau SCRAPER_EXPORTS (dipisah koma, default all)"""
+    parser = argparse.ArgumentParser(description='Web scraping informasi beasiswa')
+    parser.add_argument('--exports', default=os.getenv('SCRAPER_EXPORTS', 'all'),
+                        help=f"ekspor yang dijalankan, dipisah koma: all atau {', '.join(EXPORTS)}")
+    args = parser.parse_args(argv)
+    
+    names = [name.strip().lower() for name in args.exports.split(',') if name.strip()]
+    if not names or 'all' in names:
+        return list(EXPORTS)
+    for name in names:
+        if name not in EXPORTS:
+            print(f"[WARNING] Ekspor {name} tidak dikenal, dilewati")
+    return [name for name in EXPORTS if name in names]
+
+def build_parquet_sink():
+    """Snapshot Parquet untuk analitik, None (dilewati) jika pyarrow tidak terpasang"""
+    if not parquet_available():
+        print("[WARNING] pyarrow tidak tersedia, skip ekspor Parquet")
+        return None
+    return ParquetSink('beasiswa_semua.parquet', row_group_size=env_int('SCRAPER_PARQUET_ROW_GROUP', 10000))
+
+def build_sinks(exports=None, keep=()):
+    """Sink output run sesuai ekspor terpilih: file backup di data/ dan sinkronisasi database
+
+    keep berisi scope (kategori, website_sumber) sumber yang dilewati filter run ini.
+    """
+    sinks = (EXPORTS[name](keep) for name in (exports or EXPORTS))
+    return [sink for sink in sinks if sink is not None]
+
+def print_export_summary(pipeline):
+    """Tampilkan waktu tulis dan jumlah record per sink"""
+    print("\n=== RINGKASAN EKSPOR ===")
+    for name, elapsed in pipeline.timings.items():
+        status = '[SUCCESS]' if pipeline.results.get(name) else '[ERROR]'
+        print(f"{status} {name}: {pipeline.counts.get(name, 0)} records, {elapsed:.2f} detik")
+
+def main(argv=None):
+    exports = selected_exports(argv)
     print("MEMULAI WEB SCRAPING INFORMASI BEASISWA")
     print(f"Waktu mulai: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    all_scholarships = []
+    reset_run_memo()
     helper = WebScraperHelper()
+    engine = ScrapeEngine(helper=helper)
+    engine.fingerprints.reset_stats()
+    workers = env_int('SCRAPER_CATEGORY_WORKERS', len(CATEGORIES))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='category') if workers > 1 else None
+    streams = []
     
     try:
-        # Jalankan scraper domestik
-        print("\n=== SCRAPING BEASISWA DOMESTIK ===")
-        domestik_scraper = DomestikScholarshipScraper()
-        domestik_data = domestik_scraper.scrape_all()
-        if domestik_data:
-            all_scholarships.extend(domestik_data)
-            print(f"[SUCCESS] Berhasil mengambil {len(domestik_data)} data domestik")
-        else:
-            print("[WARNING] Tidak ada data domestik yang berhasil diambil")
+        plan = engine.plan()
+        print(f"[INFO] Rencana run: {len(plan)} sumber, "
+              f"{len({url for source in plan for url in source.urls})} URL unik")
         
-        time.sleep(2)
-        
-        # Jalankan scraper internasional
-        print("\n=== SCRAPING BEASISWA INTERNASIONAL ===")
-        internasional_scraper = InternasionalScholarshipScraper()
-        internasional_data = internasional_scraper.scrape_all()
-        if internasional_data:
-            all_scholarships.extend(internasional_data)
-            print(f"[SUCCESS] Berhasil mengambil {len(internasional_data)} data internasional")
-        else:
-            print("[WARNING] Tidak ada data internasional yang berhasil diambil")
-        
-        time.sleep(2)
-        
-        # Jalankan scraper PT dalam negeri
-        print("\n=== SCRAPING BEASISWA PT DALAM NEGERI ===")
-        pt_dalam_scraper = UniversitasDalamNegeriScraper()
-        pt_dalam_data = pt_dalam_scraper.scrape_all()
-        if pt_dalam_data:
-            all_scholarships.extend(pt_dalam_data)
-            print(f"[SUCCESS] Berhasil mengambil {len(pt_dalam_data)} data PT dalam negeri")
-        else:
-            print("[WARNING] Tidak ada data PT dalam negeri yang berhasil diambil")
-        
-        time.sleep(2)
-        
-        # Jalankan scraper PT luar negeri
-        print("\n=== SCRAPING BEASISWA PT LUAR NEGERI ===")
-        pt_luar_scraper = UniversitasLuarNegeriScraper()
-        pt_luar_data = pt_luar_scraper.scrape_all()
-        if pt_luar_data:
-            all_scholarships.extend(pt_luar_data)
-            print(f"[SUCCESS] Berhasil mengambil {len(pt_luar_data)} data PT luar negeri")
-        else:
-            print("[WARNING] Tidak ada data PT luar negeri yang berhasil diambil")
-        
-        # Simpan semua data
-        if all_scholarships:
-            print(f"\n=== MENYIMPAN {len(all_scholarships)} DATA BEASISWA ===")
+        # Record mengalir dari scraper ke sink satu per satu: file dan database terisi
+        # bertahap sehingga memori tidak tumbuh dengan jumlah record dan data yang sudah
+        # didapat tetap tersimpan walau run berhenti di tengah. Keempat kategori berjalan
+        # paralel, laporan tetap dengan urutan kategori yang tetap.
+        print(f"[INFO] Ekspor: {', '.join(exports)}")
+        parallel = env_int('SCRAPER_PARALLEL_SINKS', 1) != 0
+        keep = engine.skipped_scopes(plan)
+        with Pipeline(build_sinks(exports, keep), parallel=parallel) as pipeline:
+            streams = stream_categories(engine, executor)
+            for judul, label, records in streams:
+                print(f"\n=== SCRAPING BEASISWA {judul} ===")
+                count = pipeline.write_all(records, with_status=True)
+                if count:
+                    print(f"[SUCCESS] Berhasil mengambil {count} data {label}")
+                else:
+                    print(f"[WARNING] Tidak ada data {label} yang berhasil diambil")
             
-            # Simpan ke database
-            db_success = save_to_database(all_scholarships)
+            # Sumber yang tidak lagi menghasilkan record dikirim sebagai perubahan 'gone'
+            for source_id, kategori, values in engine.finish(plan):
+                pipeline.write(Scholarship.from_dict(dict(values, tanggal_update=helper.get_current_date())), GONE)
             
-            # Simpan ke file sebagai backup
-            helper.save_to_json(all_scholarships, 'beasiswa_semua.json')
-            helper.save_to_excel(all_scholarships, 'beasiswa_semua.xlsx')
-            helper.save_to_csv(all_scholarships, 'beasiswa_semua.csv')
+            print_fetch_summary(helper)
+            print_change_summary(engine)
+            print(f"\n=== MENYIMPAN {pipeline.count} DATA BEASISWA ===")
+        
+        print_export_summary(pipeline)
+        
+        total = pipeline.count
+        if total:
+            db_success = pipeline.results.get('database', False)
+            # Sidik jari hanya disimpan setelah run selesai agar perubahan tidak hilang jika run gagal
+            engine.fingerprints.save()
             
             print("SCRAPING SELESAI!")
-            print(f"Total data: {len(all_scholarships)} beasiswa")
-            print(f"Database: {'[SUCCESS] Berhasil' if db_success else '[ERROR] Gagal'}")
+            print(f"Total data: {total} beasiswa")
+            if 'database' in exports:
+                print(f"Database: {'[SUCCESS] Berhasil' if db_success else '[ERROR] Gagal'}")
+            else:
+                print("Database: [INFO] Dilewati (tidak ada di ekspor terpilih)")
             print(f"File backup: [SUCCESS] Tersimpan di folder 'data/'")
             
             # Output untuk scheduler service
-            print(f"Processed {len(all_scholarships)} records")
+            print(f"Processed {total} records")
             
             sys.exit(0)  # Exit dengan code 0 untuk success
         else:
@@ -179,6 +301,12 @@ def main():
     except Exception as e:
         print(f"[ERROR] Error tidak terduga: {e}")
         sys.exit(1)
+    finally:
+        # Hentikan produsen kategori yang belum selesai dikonsumsi
+        for _, _, records in streams:
+            records.close()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -16,8 +16,12 @@ from datetime import datetime, timedelta, timezone
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+from utils.db_pool import db_pool_stats, get_db_pool
+from utils.settings import env_int
+
 # Load environment variables
 load_dotenv()
 
@@ -45,6 +49,29 @@ TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 SCHEDULER_PORT = int(os.getenv('SCHEDULER_PORT', 3001))
 
+def create_http_session():
+    """Session HTTP bersama dengan connection pool keep-alive untuk panggilan ke Vercel dan Telegram"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=env_int('SCHEDULER_HTTP_POOL_SIZE', 10))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+http_session = create_http_session()
+
+def http_pool_stats():
+    """Utilisasi pool HTTP per host: koneksi yang pernah dibuka dan request yang dikirim"""
+    stats = {}
+    for adapter in set(http_session.adapters.values()):
+        for key in adapter.poolmanager.pools.keys():
+            pool = adapter.poolmanager.pools.get(key)
+            if pool is not None:
+                stats[f"{pool.scheme}://{pool.host}"] = {
+                    'connections': pool.num_connections,
+                    'requests': pool.num_requests
+                }
+    return stats
+
 def get_next_update_time():
     """Get next update time (17:00 UTC = 00:00 WIB)"""
     now = datetime.now(timezone.utc)
@@ -68,7 +95,7 @@ def send_telegram_notification(message):
             'text': message,
             'parse_mode': 'HTML'
         }
-        response = requests.post(url, json=data, timeout=10)
+        response = http_session.post(url, json=data, timeout=10)
         if response.status_code == 200:
             logger.info("Telegram notification sent successfully")
         else:
@@ -88,7 +115,7 @@ def execute_scraping():
         
         # Clear previous logs from database
         try:
-            response = requests.delete(f"{VERCEL_URL}/api/logs", timeout=10)
+            response = http_session.delete(f"{VERCEL_URL}/api/logs", timeout=10)
             logger.info("🗑️ Previous logs cleared from database")
         except Exception as e:
             logger.error(f"Failed to clear previous logs: {e}")
@@ -106,7 +133,7 @@ def execute_scraping():
         
         # Save initial log to database
         try:
-            response = requests.post(
+            response = http_session.post(
                 f"{VERCEL_URL}/api/logs",
                 json={'logs': [initial_log]},
                 headers={'Content-Type': 'application/json'},
@@ -131,16 +158,14 @@ def execute_scraping():
                 import psycopg2
                 logger.info("✅ psycopg2 imported successfully")
                 
-                # Try to connect to database
+                # Try to connect to database (koneksi dipinjam dari pool proses)
                 if DATABASE_URL:
                     try:
-                        conn = psycopg2.connect(DATABASE_URL)
-                        cursor = conn.cursor()
-                        cursor.execute("SELECT version();")
-                        version = cursor.fetchone()
+                        with get_db_pool().connection() as conn:
+                            with conn.cursor() as cursor:
+                                cursor.execute("SELECT version();")
+                                version = cursor.fetchone()
                         logger.info(f"✅ Database connected successfully! PostgreSQL version: {version[0]}")
-                        cursor.close()
-                        conn.close()
                     except Exception as e:
                         logger.error(f"❌ Database connection failed: {e}")
                 else:
@@ -213,7 +238,7 @@ def execute_scraping():
             
             # Get beasiswa count
             try:
-                response = requests.get(f"{VERCEL_URL}/api/beasiswa", timeout=10)
+                response = http_session.get(f"{VERCEL_URL}/api/beasiswa", timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     total_beasiswa = len(data.get('data', []))
@@ -268,7 +293,7 @@ def execute_scraping():
         
         # Save logs to database
         try:
-            response = requests.post(
+            response = http_session.post(
                 f"{VERCEL_URL}/api/logs",
                 json={'logs': scheduler_state['logs']},
                 headers={'Content-Type': 'application/json'},
@@ -317,6 +342,10 @@ def health_check():
             'lastUpdate': scheduler_state['lastUpdate'],
             'nextUpdate': scheduler_state['nextUpdate'],
             'isUpdating': scheduler_state['isUpdating']
+        },
+        'pools': {
+            'database': db_pool_stats(),
+            'http': http_pool_stats()
         }
     })
 
@@ -336,7 +365,7 @@ def get_logs():
     """Get logs from database"""
     try:
         # Try to get logs from database first
-        response = requests.get(f"{VERCEL_URL}/api/logs?limit=50", timeout=10)
+        response = http_session.get(f"{VERCEL_URL}/api/logs?limit=50", timeout=10)
         if response.status_code == 200:
             data = response.json()
             if 'logs' in data and data['logs']:
@@ -484,7 +513,7 @@ def get_beasiswa():
         if kategori:
             api_url += f"?kategori={kategori}"
         
-        response = requests.get(api_url, timeout=10)
+        response = http_session.get(api_url, timeout=10)
         return jsonify(response.json())
     except Exception as e:
         logger.error(f"Failed to fetch beasiswa data: {e}")
@@ -0,0 +1,235 @@
+import asyncio
+import itertools
+import os
+from collections import deque
+
+from scrapers.registry import get_registry
+from utils.fingerprints import get_fingerprint_store
+from utils.helpers import WebScraperHelper
+from utils.page_needs import normalize_needs
+from utils.parse_pool import get_parse_pool
+from utils.records import Scholarship, ScholarshipBatch
+from utils.run_memo import get_run_memo
+from utils.settings import env_int
+
+
+def _env_ids(name):
+    """Daftar ID sumber dari variabel environment (dipisah koma)"""
+    return {item.strip() for item in os.getenv(name, '').split(',') if item.strip()}
+
+
+class ScrapeEngine:
+    """Menjalankan sumber dari registry: rencanakan seluruh run, ambil semua halaman
+    secara konkuren, dan ekstrak record di pool proses begitu halamannya tiba"""
+
+    def __init__(self, registry=None, helper=None, parse_pool=None, fingerprints=None):
+        self.registry = registry or get_registry()
+        self.helper = helper or WebScraperHelper()
+        self.parse_pool = parse_pool or get_parse_pool()
+        self.fingerprints = fingerprints or get_fingerprint_store()
+        # ID sumber yang menghasilkan record di run ini (untuk mendeteksi sumber hilang)
+        self.seen = set()
+        # Jumlah sumber yang boleh diproses bersamaan saat streaming (backpressure)
+        self.stream_buffer = max(1, env_int('SCRAPER_STREAM_BUFFER', 16))
+
+    def plan(self, categories=None, ids=None, skip=None):
+        """Pilih sumber aktif (SCRAPER_SOURCES / SCRAPER_SKIP_SOURCES jika tidak diberikan)
+        urut prioritas, dan terapkan jadwal refresh serta jeda per host"""
+        ids = _env_ids('SCRAPER_SOURCES') if ids is None else ids
+        skip = _env_ids('SCRAPER_SKIP_SOURCES') if skip is None else skip
+        sources = self.registry.select(categories=categories, ids=ids, skip=skip)
+
+        for source in sources:
+            for url in source.urls:
+                if source.refresh_hours is not None:
+                    self.helper.page_store.set_ttl(url, float(source.refresh_hours) * 3600)
+                if source.delay is not None:
+                    self.helper.set_host_delay(url, source.delay)
+        return sources
+
+    def build_record(self, source, url, values):
+        """Record beasiswa lengkap dari nilai field registry"""
+        return Scholarship(
+            nama_beasiswa=values['nama_beasiswa'],
+            kategori=source.kategori,
+            website_sumber=url,
+            deskripsi=values['deskripsi'],
+            persyaratan=values['persyaratan'],
+            deadline=values['deadline'],
+            link_pendaftaran=url,
+            tanggal_update=self.helper.get_current_date()
+        )
+
+    async def extract(self, source):
+        """Ambil halaman sumber lalu ekstrak record dari URL pertama yang berhasil, atau record fallback
+
+        URL cadangan baru diambil jika URL sebelumnya gagal atau tidak ada field yang terekstrak,
+        jadi host yang dibatasi jedanya tidak menerima request yang tidak perlu. Hasil berupa
+        (record, status) dengan status new/changed/unchanged dari fingerprint store; halaman
+        yang tidak berubah sejak run sebelumnya tidak diekstrak ulang.
+        """
+        print(f"Mengambil data {source.name}...")
+
+        memo = get_run_memo()
+        needs = normalize_needs(source.needs)
+        # Halaman terbaca tanpa field terekstrak, dipakai jika URL cadangan juga tidak lebih baik
+        candidate = None
+        for url in source.urls:
+            try:
+                pages = await self.helper.fetcher.fetch_all([url], consumer=source.id, needs=source.needs)
+                html = pages.get(url)
+                if not html:
+                    continue
+
+                page_hash = self.fingerprints.page_hash(source.spec, url, html)
+                values = self.fingerprints.unchanged_values(source.id, page_hash)
+                if values is None:
+                    values = dict(source.record)
+                    # Sumber tanpa aturan ekstraksi tidak perlu di-parse sama sekali
+                    if source.extract:
+                        texts = await self.extract_fields(url, html, source)
+                        if not any(texts.values()):
+                            candidate = candidate or (url, values, page_hash)
+                            continue
+                        values.update((field, text) for field, text in texts.items() if text)
+                return self._result(source, url, values, page_hash)
+            except Exception as e:
+                print(f"Error scraping {source.name}: {str(e)}")
+            finally:
+                # Halaman ini sudah selesai dipakai, jangan ditahan di memori sampai akhir run
+                memo.release((url, needs))
+
+        if candidate:
+            return self._result(source, *candidate)
+        if source.fallback:
+            print(f"Menggunakan data fallback untuk {source.name}")
+            return self._result(source, source.urls[0], source.fallback, None)
+        return None, None
+
+    async def extract_fields(self, url, html, source):
+        """Teks field dari HTML di parse pool; sumber lain dengan halaman dan aturan yang sama
+        di run ini memakai hasil yang sama tanpa parse ulang"""
+        only = source.needs or ()
+        rules = tuple(source.extract.items())
+        page = (url, normalize_needs(source.needs))
+        future, owner = get_run_memo().claim_extract(page, (hash(html), tuple(only), rules))
+        if not owner:
+            return await asyncio.wrap_future(future)
+
+        try:
+            texts = await self.parse_pool.extract(html, only, rules)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        future.set_result(texts)
+        return texts
+
+    def _result(self, source, url, values, page_hash):
+        record = self.build_record(source, url, values)
+        status = self.fingerprints.update(source.id, source.category, page_hash, record.to_dict())
+        self.seen.add(source.id)
+        return record, status
+
+    async def _run(self, sources):
+        results = await asyncio.gather(*(self.extract(source) for source in sources))
+        return ScholarshipBatch(record for record, _ in results if record)
+
+    def run(self, sources):
+        """Ambil dan ekstrak semua sumber secara konkuren, hasil berupa ScholarshipBatch sesuai urutan rencana"""
+        return self.helper.client.run(self._run(sources))
+
+    def stream(self, sources, buffer=None, with_status=False):
+        """Generator record sesuai urutan rencana, atau (record, status) jika with_status
+
+        Paling banyak `buffer` sumber diproses bersamaan; sumber berikutnya baru mulai
+        di-fetch setelah pemanggil mengambil record, sehingga memori tetap konstan
+        berapa pun jumlah sumbernya.
+        """
+        buffer = self.stream_buffer if buffer is None else max(1, buffer)
+        client = self.helper.client
+        sources = iter(sources)
+        pending = deque(client.submit(self.extract(source)) for source in itertools.islice(sources, buffer))
+        try:
+            while pending:
+                record, status = pending.popleft().result()
+                next_source = next(sources, None)
+                if next_source is not None:
+                    pending.append(client.submit(self.extract(next_source)))
+                if record:
+                    yield (record, status) if with_status else record
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def finish(self, plan):
+        """Akhiri run penuh: sumber yang tidak menghasilkan record ditandai hilang
+
+        Sumber aktif yang sengaja dilewati lewat filter (SCRAPER_SOURCES / SCRAPER_SKIP_SOURCES)
+        tidak dianggap hilang. Kembalikan list (id, kategori, values) sumber yang hilang.
+        """
+        skipped = {source.id for source in self.skipped(plan)}
+        categories = set(self.registry.categories)
+        return self.fingerprints.finish(self.seen, categories, keep_ids=skipped)
+
+    def skipped(self, plan):
+        """Sumber aktif yang tidak ada di rencana karena filter SCRAPER_SOURCES / SCRAPER_SKIP_SOURCES"""
+        planned = {source.id for source in plan}
+        return [source for source in self.registry.select() if source.id not in planned]
+
+    def skipped_scopes(self, plan):
+        """Pasangan (kategori, website_sumber) record milik sumber yang dilewati filter;
+        data mereka di database tidak boleh dihapus oleh run ini"""
+        return frozenset((source.kategori, url) for source in self.skipped(plan) for url in source.urls)
+
+
+class CategoryScraper:
+    """Tampilan satu kategori registry dengan API scraper lama (scrape_all, scrape_<id>)"""
+
+    CATEGORY = None
+
+    def __init__(self, engine=None):
+        self.engine = engine or ScrapeEngine()
+        self.helper = self.engine.helper
+        self.scholarships = ScholarshipBatch()
+
+    @property
+    def sources(self):
+        """Sumber aktif kategori ini sesuai rencana engine"""
+        return self.engine.plan(categories=[self.CATEGORY])
+
+    @property
+    def urls(self):
+        """Semua URL yang dipakai kategori ini"""
+        return [url for source in self.sources for url in source.urls]
+
+    def stream(self, with_status=False):
+        """Generator record kategori ini (atau (record, status)), diproses bertahap dengan buffer terbatas"""
+        label = self.engine.registry.category_label(self.CATEGORY)
+        print(f"Memulai scraping beasiswa {label}...")
+
+        count = 0
+        for item in self.engine.stream(self.sources, with_status=with_status):
+            count += 1
+            yield item
+
+        print(f"Berhasil mengambil {count} beasiswa {label}")
+
+    def scrape_all(self):
+        """Jalankan semua sumber kategori ini"""
+        self.scholarships.extend(self.stream())
+        return self.scholarships
+
+    def scrape_source(self, source_id):
+        """Jalankan satu sumber berdasarkan ID registry"""
+        source = self.engine.registry.get(source_id)
+        if source is None or source.category != self.CATEGORY:
+            raise ValueError(f"Sumber {source_id} tidak ada di kategori {self.CATEGORY}")
+        self.scholarships.extend(self.engine.run([source]))
+
+    def __getattr__(self, name):
+        # Kompatibilitas metode lama scrape_<id>, misal scrape_lpdp()
+        if name.startswith('scrape_') and 'engine' in self.__dict__:
+            source = self.engine.registry.get(name[len('scrape_'):])
+            if source is not None and source.category == self.CATEGORY:
+                return lambda: self.scrape_source(source.id)
+        raise AttributeError(f"{type(self).__name__} tidak memiliki atribut {name}")
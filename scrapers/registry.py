@@ -0,0 +1,111 @@
+import json
+import os
+import threading
+
+# Registry sumber beasiswa bawaan, bisa diganti lewat SCRAPER_SOURCES_FILE
+DEFAULT_REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sources.json')
+
+# Field record yang diisi dari registry (kategori, URL dan tanggal diisi engine)
+RECORD_FIELDS = ('nama_beasiswa', 'deskripsi', 'persyaratan', 'deadline')
+
+
+class Source:
+    """Satu sumber beasiswa: URL, kategori, aturan ekstraksi, record fallback dan jadwal"""
+
+    def __init__(self, data, defaults, categories):
+        merged = dict(defaults)
+        merged.update(data)
+
+        for key in ('id', 'category', 'urls', 'record'):
+            if not merged.get(key):
+                raise ValueError(f"Sumber {data.get('id', '?')} tidak memiliki field '{key}'")
+        if merged['category'] not in categories:
+            raise ValueError(f"Sumber {merged['id']} memakai kategori tidak dikenal: {merged['category']}")
+
+        self.id = merged['id']
+        self.name = merged.get('name') or self.id
+        self.category = merged['category']
+        self.kategori = categories[self.category]['kategori']
+        self.urls = list(merged['urls'])
+        self.needs = tuple(merged.get('needs') or ()) or None
+        # field record -> selector CSS; teks elemen menggantikan nilai record jika ditemukan
+        self.extract = dict(merged.get('extract') or {})
+        self.record = self._fields(merged['record'])
+        self.fallback = self._fields(merged['fallback']) if merged.get('fallback') else None
+        self.priority = int(merged.get('priority', 100))
+        self.enabled = bool(merged.get('enabled', True))
+        # Interval refresh halaman (jam), dipakai sebagai TTL page store untuk host sumber
+        self.refresh_hours = merged.get('refresh_hours')
+        # Jeda sopan khusus untuk host sumber (detik)
+        self.delay = merged.get('delay')
+
+    @property
+    def spec(self):
+        """Aturan sumber yang mempengaruhi hasil ekstraksi, ikut di-hash pada sidik jari halaman"""
+        return {'category': self.category, 'extract': self.extract, 'record': self.record}
+
+    def _fields(self, values):
+        missing = [field for field in RECORD_FIELDS if field not in values]
+        if missing:
+            raise ValueError(f"Sumber {self.id} tidak memiliki field record: {', '.join(missing)}")
+        return {field: values[field] for field in RECORD_FIELDS}
+
+    def __repr__(self):
+        return f"Source({self.id!r}, {self.category!r})"
+
+
+class SourceRegistry:
+    """Daftar sumber beasiswa yang dibaca dari file JSON"""
+
+    def __init__(self, sources, categories):
+        self.sources = sources
+        self.categories = categories
+        self._by_id = {}
+        for source in sources:
+            if source.id in self._by_id:
+                raise ValueError(f"ID sumber duplikat di registry: {source.id}")
+            self._by_id[source.id] = source
+
+    @classmethod
+    def load(cls, path=None):
+        """Muat registry dari file JSON (default scrapers/sources.json atau SCRAPER_SOURCES_FILE)"""
+        path = path or os.getenv('SCRAPER_SOURCES_FILE') or DEFAULT_REGISTRY_PATH
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        categories = data.get('categories', {})
+        defaults = data.get('defaults', {})
+        sources = [Source(item, defaults, categories) for item in data.get('sources', [])]
+        return cls(sources, categories)
+
+    def get(self, source_id):
+        """Sumber berdasarkan ID, None jika tidak ada"""
+        return self._by_id.get(source_id)
+
+    def category_label(self, category):
+        """Label kategori untuk pesan log, misal 'perguruan tinggi dalam negeri'"""
+        return self.categories[category].get('label', category)
+
+    def select(self, categories=None, ids=None, skip=None):
+        """Sumber aktif yang dipilih, diurutkan berdasarkan prioritas (kecil lebih dulu) lalu urutan registry"""
+        selected = [
+            source for source in self.sources
+            if source.enabled
+            and (categories is None or source.category in categories)
+            and (not ids or source.id in ids)
+            and (not skip or source.id not in skip)
+        ]
+        return sorted(selected, key=lambda source: source.priority)
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    """Registry sumber untuk seluruh proses, dimuat sekali"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SourceRegistry.load()
+        return _registry
@@ -61,6 +61,22 @@ class DatabaseConnection {
     }
   }
 
+  public async transaction<T>(callback: (client: PoolClient) => Promise<T>): Promise<T> {
+    const client = await this.getClient()
+    try {
+      await client.query('BEGIN')
+      const result = await callback(client)
+      await client.query('COMMIT')
+      return result
+    } catch (error) {
+      await client.query('ROLLBACK')
+      logger.error('Database transaction rolled back:', error instanceof Error ? error : new Error(String(error)))
+      throw error
+    } finally {
+      client.release()
+    }
+  }
+
   public async close(): Promise<void> {
     if (this.pool) {
       await this.pool.end()
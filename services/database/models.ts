@@ -1,3 +1,4 @@
+import { PoolClient } from 'pg'
 import { db } from './connection'
 import { logger } from '@/utils/logger'
 
@@ -9,10 +10,21 @@ export interface Beasiswa {
   link: string
   kategori: string
   sumber: string
+  record_key?: string | null
+  content_hash?: string | null
   created_at?: Date
   updated_at?: Date
 }
 
+export interface BeasiswaDelta {
+  inserts: Beasiswa[]
+  updates: Beasiswa[]
+  deletes: string[]
+  replace: boolean
+  // record_key yang dikirim di request lain pada sinkronisasi replace bertahap, tidak ikut dihapus
+  keep?: string[]
+}
+
 export interface SchedulerStatus {
   id?: number
   is_enabled: boolean
@@ -32,6 +44,8 @@ export interface Log {
 }
 
 export class BeasiswaModel {
+  private static tableReady = false
+
   static async createTable(): Promise<void> {
     try {
       await db.query(`
@@ -43,10 +57,17 @@ export class BeasiswaModel {
           link TEXT,
           kategori VARCHAR(100),
           sumber VARCHAR(100),
+          record_key VARCHAR(64),
+          content_hash VARCHAR(64),
           created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
           updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
       `)
+      // Tabel lama dibuat sebelum ada record_key/content_hash (dipakai sinkronisasi delta dan upsert)
+      await db.query('ALTER TABLE beasiswa ADD COLUMN IF NOT EXISTS record_key VARCHAR(64)')
+      await db.query('ALTER TABLE beasiswa ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)')
+      await db.query('CREATE UNIQUE INDEX IF NOT EXISTS beasiswa_record_key_idx ON beasiswa (record_key)')
+      BeasiswaModel.tableReady = true
       logger.info('Beasiswa table created/verified')
     } catch (error) {
       logger.error('Error creating beasiswa table:', error instanceof Error ? error : new Error(String(error)))
@@ -58,9 +79,14 @@ export class BeasiswaModel {
     if (beasiswaList.length === 0) return
 
     try {
+      // Tabel dari skrip init lama belum punya kolom record_key
+      if (!BeasiswaModel.tableReady) {
+        await BeasiswaModel.createTable()
+      }
+
       const values = beasiswaList.map((_, index) => {
-        const offset = index * 6
-        return `($${offset + 1}, $${offset + 2}, $${offset + 3}, $${offset + 4}, $${offset + 5}, $${offset + 6})`
+        const offset = index * 7
+        return `($${offset + 1}, $${offset + 2}, $${offset + 3}, $${offset + 4}, $${offset + 5}, $${offset + 6}, $${offset + 7})`
       }).join(', ')
 
       const params = beasiswaList.flatMap(item => [
@@ -69,11 +95,12 @@ export class BeasiswaModel {
         item.deadline || '',
         item.link || '',
         item.kategori || '',
-        item.sumber || ''
+        item.sumber || '',
+        item.record_key || null
       ])
 
       await db.query(`
-        INSERT INTO beasiswa (judul, deskripsi, deadline, link, kategori, sumber)
+        INSERT INTO beasiswa (judul, deskripsi, deadline, link, kategori, sumber, record_key)
         VALUES ${values}
       `, params)
 
@@ -84,6 +111,83 @@ export class BeasiswaModel {
     }
   }
 
+  static async upsertMany(beasiswaList: Beasiswa[], client: PoolClient): Promise<{ inserted: number, updated: number }> {
+    let inserted = 0
+    let updated = 0
+
+    // Batasi jumlah parameter per query (maksimal 65535 di PostgreSQL)
+    for (let start = 0; start < beasiswaList.length; start += 1000) {
+      const chunk = beasiswaList.slice(start, start + 1000)
+      const values = chunk.map((_, index) => {
+        const offset = index * 8
+        return `($${offset + 1}, $${offset + 2}, $${offset + 3}, $${offset + 4}, $${offset + 5}, $${offset + 6}, $${offset + 7}, $${offset + 8})`
+      }).join(', ')
+
+      const params = chunk.flatMap(item => [
+        item.judul || 'Unknown',
+        item.deskripsi || '',
+        item.deadline || '',
+        item.link || '',
+        item.kategori || '',
+        item.sumber || '',
+        item.record_key,
+        item.content_hash || null
+      ])
+
+      // Baris yang isinya tidak berubah tidak ditulis ulang (created_at/updated_at tetap)
+      const result = await client.query(`
+        INSERT INTO beasiswa (judul, deskripsi, deadline, link, kategori, sumber, record_key, content_hash)
+        VALUES ${values}
+        ON CONFLICT (record_key) DO UPDATE
+        SET judul = EXCLUDED.judul, deskripsi = EXCLUDED.deskripsi, deadline = EXCLUDED.deadline,
+            link = EXCLUDED.link, kategori = EXCLUDED.kategori, sumber = EXCLUDED.sumber,
+            content_hash = EXCLUDED.content_hash, updated_at = CURRENT_TIMESTAMP
+        WHERE beasiswa.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+        RETURNING (xmax = 0) AS inserted
+      `, params)
+
+      for (const row of result.rows) {
+        if (row.inserted) inserted++
+        else updated++
+      }
+    }
+
+    return { inserted, updated }
+  }
+
+  static async applyDelta(delta: BeasiswaDelta): Promise<{ inserted: number, updated: number, deleted: number }> {
+    try {
+      if (!BeasiswaModel.tableReady) {
+        await BeasiswaModel.createTable()
+      }
+
+      // Satu transaksi: pembaca tetap melihat data lama sampai commit, tabel tidak pernah kosong
+      return await db.transaction(async client => {
+        const upserts = [...delta.inserts, ...delta.updates]
+        const { inserted, updated } = await BeasiswaModel.upsertMany(upserts, client)
+
+        let deleted = 0
+        if (delta.replace) {
+          // Sinkronisasi penuh: hapus semua baris yang tidak ada di run ini, termasuk baris lama tanpa record_key
+          const keys = [...upserts.map(item => item.record_key), ...(delta.keep || [])]
+          const result = await client.query(
+            'DELETE FROM beasiswa WHERE record_key IS NULL OR NOT (record_key = ANY($1))', [keys]
+          )
+          deleted = result.rowCount || 0
+        } else if (delta.deletes.length > 0) {
+          const result = await client.query('DELETE FROM beasiswa WHERE record_key = ANY($1)', [delta.deletes])
+          deleted = result.rowCount || 0
+        }
+
+        logger.info(`Applied beasiswa delta: ${inserted} inserted, ${updated} updated, ${deleted} deleted`)
+        return { inserted, updated, deleted }
+      })
+    } catch (error) {
+      logger.error('Error applying beasiswa delta:', error instanceof Error ? error : new Error(String(error)))
+      throw error
+    }
+  }
+
   static async getAll(): Promise<Beasiswa[]> {
     try {
       const result = await db.query(`
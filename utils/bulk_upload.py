@@ -0,0 +1,206 @@
+import asyncio
+import gzip
+import itertools
+import json
+import time
+
+import aiohttp
+
+from utils.http_client import get_http_client
+from utils.records import ScholarshipBatch
+from utils.retry import RETRYABLE_STATUS, RetryPolicy, parse_retry_after
+from utils.settings import env_int
+
+
+def json_body(payload, compress=True):
+    """Body request JSON beserta header-nya, dikompres gzip jika compress"""
+    data = payload.encode('utf-8') if isinstance(payload, str) else payload
+    headers = {'Content-Type': 'application/json'}
+    if compress:
+        data = gzip.compress(data, compresslevel=6)
+        headers['Content-Encoding'] = 'gzip'
+    return data, headers
+
+
+def upload_payload(records_json, clear_first):
+    """Body POST /api/beasiswa dari array JSON record"""
+    return '{"beasiswaList": ' + records_json + ', "clearFirst": ' + ('true' if clear_first else 'false') + '}'
+
+
+def delta_payload(inserts='[]', updates='[]', deletes=(), replace=False, keep=None):
+    """Body PATCH /api/beasiswa dari array JSON inserts/updates, record_key yang dihapus
+    dan (untuk replace yang dikirim bertahap) record_key yang sudah dikirim di chunk lain"""
+    rest = {'deletes': list(deletes), 'replace': replace}
+    if keep is not None:
+        rest['keep'] = keep
+    return '{"inserts": ' + inserts + ', "updates": ' + updates + ', ' + json.dumps(rest)[1:]
+
+
+class BulkUploader:
+    """Upload record ke /api/beasiswa dalam chunk berbatas ukuran
+
+    Setiap chunk dikompres gzip dan dikirim paralel dengan jumlah worker terbatas; chunk
+    yang gagal karena gangguan sementara dicoba ulang sendiri tanpa mengulang chunk lain.
+    PATCH (upsert per record_key) aman diulang untuk semua gangguan sementara; POST hanya
+    diulang jika pasti belum diproses server (koneksi gagal dibuka, atau 429/503 dengan
+    Retry-After) agar chunk tidak ter-insert dua kali.
+    Chunk pertama yang mengosongkan tabel (clearFirst) selalu selesai sebelum chunk lain dikirim,
+    dan penghapusan sinkronisasi delta baru dikirim setelah semua chunk upsert berhasil.
+    """
+
+    def __init__(self, url, max_chunk_bytes=256 * 1024, workers=4, compress=True, retry_policy=None,
+                 timeout=60, client=None):
+        self.url = url
+        self.max_chunk_bytes = max(1024, max_chunk_bytes)
+        self.workers = max(1, workers)
+        self.compress = compress
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=3)
+        self.timeout = timeout
+        self.client = client or get_http_client()
+
+    @classmethod
+    def from_env(cls, url):
+        """Buat uploader dari SCRAPER_UPLOAD_CHUNK_KB, SCRAPER_UPLOAD_WORKERS, SCRAPER_UPLOAD_RETRIES, SCRAPER_UPLOAD_GZIP"""
+        return cls(
+            url,
+            max_chunk_bytes=env_int('SCRAPER_UPLOAD_CHUNK_KB', 256) * 1024,
+            workers=env_int('SCRAPER_UPLOAD_WORKERS', 4),
+            compress=env_int('SCRAPER_UPLOAD_GZIP', 1) != 0,
+            retry_policy=RetryPolicy(max_attempts=env_int('SCRAPER_UPLOAD_RETRIES', 3)),
+        )
+
+    def chunks(self, records):
+        """Potong record menjadi list (jumlah record, array JSON) dengan ukuran tidak melebihi batas
+
+        Record tunggal yang lebih besar dari batas tetap dikirim sebagai chunk sendiri.
+        """
+        if isinstance(records, ScholarshipBatch):
+            objects = records.json_objects()
+        else:
+            objects = (json.dumps(record, ensure_ascii=False) for record in records)
+
+        chunks = []
+        current = []
+        size = 2
+        for item in objects:
+            item_size = len(item.encode('utf-8')) + 2
+            if current and size + item_size > self.max_chunk_bytes:
+                chunks.append((len(current), '[' + ', '.join(current) + ']'))
+                current = []
+                size = 2
+            current.append(item)
+            size += item_size
+        if current:
+            chunks.append((len(current), '[' + ', '.join(current) + ']'))
+        return chunks
+
+    async def _send(self, index, total, count, payload, method='POST'):
+        data, headers = json_body(payload, self.compress)
+        idempotent = method != 'POST'
+
+        attempt = 0
+        while True:
+            attempt += 1
+            error = None
+            retry_after = None
+            try:
+                response = await self.client.request(method, self.url, data=data, headers=headers, timeout=self.timeout)
+                if response.status_code == 200:
+                    result = response.json()
+                    if result.get('success'):
+                        print(f"[INFO] Chunk {index}/{total} terkirim: {count} records, {len(data) / 1024:.1f} KB")
+                        return len(data)
+                    print(f"[ERROR] Chunk {index}/{total} ditolak: {result.get('message', 'Unknown error')}")
+                    return None
+                error = f"HTTP Error {response.status_code}: {response.text[:200]}"
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if idempotent:
+                    retryable = response.status_code in RETRYABLE_STATUS
+                else:
+                    # Server menolak sebelum memproses request
+                    retryable = response.status_code in (429, 503) and retry_after is not None
+            except aiohttp.ClientConnectorError as e:
+                # Koneksi tidak pernah terbuka, request belum terkirim
+                error = f"Network error: {e}"
+                retryable = True
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Server mungkin sudah memproses request sebelum koneksi putus atau timeout
+                error = f"Network error: {e}"
+                retryable = idempotent
+
+            delay = self.retry_policy.backoff(attempt, retry_after) if retryable else None
+            if delay is None:
+                print(f"[ERROR] Chunk {index}/{total} gagal setelah {attempt} percobaan: {error}")
+                return None
+            print(f"[WARNING] Chunk {index}/{total} gagal ({error}), retry dalam {delay:.1f} detik")
+            await asyncio.sleep(delay)
+
+    async def _upload(self, payloads, method='POST', first=False, last=False):
+        """Kirim list (jumlah record, body); first/last dikirim sendiri sebelum/sesudah chunk lain
+        dan hanya jika semua chunk sebelumnya berhasil. Hasil berupa ukuran terkirim per chunk (None jika gagal)"""
+        total = len(payloads)
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def send(index):
+            async with semaphore:
+                count, payload = payloads[index]
+                return await self._send(index + 1, total, count, payload, method)
+
+        start = 1 if first and total > 1 else 0
+        end = total - 1 if last and total > 1 else total
+        sent = [await send(0)] if start else []
+        if start and sent[0] is None:
+            return sent + [None] * (total - 1)
+        sent.extend(await asyncio.gather(*(send(index) for index in range(start, end))))
+        if end < total:
+            sent.append(await send(end) if None not in sent else None)
+        return sent
+
+    def _report(self, payloads, sent, started):
+        """Cetak throughput upload, kembalikan True jika semua chunk berhasil"""
+        elapsed = max(time.perf_counter() - started, 1e-6)
+        done = [(count, size) for (count, _), size in zip(payloads, sent) if size is not None]
+        records_sent = sum(count for count, _ in done)
+        bytes_sent = sum(size for _, size in done)
+        print(f"[INFO] Upload: {records_sent} records dalam {len(done)}/{len(payloads)} chunk, "
+              f"{elapsed:.1f} detik ({records_sent / elapsed:.0f} records/s, {bytes_sent / 1024 / elapsed:.1f} KB/s)")
+        return len(done) == len(payloads)
+
+    def upload(self, records, clear_first=True):
+        """Upload semua record lewat POST, kembalikan True jika semua chunk berhasil"""
+        payloads = [
+            (count, upload_payload(records_json, clear_first and index == 0))
+            for index, (count, records_json) in enumerate(self.chunks(records))
+        ]
+        if not payloads:
+            return True
+
+        started = time.perf_counter()
+        sent = self.client.run(self._upload(payloads, first=clear_first))
+        return self._report(payloads, sent, started)
+
+    def sync(self, inserts, updates, deletes=(), replace=False):
+        """Kirim delta (list dict dengan record_key) lewat PATCH, kembalikan True jika semua request berhasil
+
+        Delta yang muat dalam satu chunk dikirim sebagai satu request (satu transaksi di API).
+        Delta yang lebih besar dikirim sebagai chunk upsert paralel (aman diulang karena upsert
+        per record_key), lalu satu request terakhir menghapus record yang hilang. Untuk replace
+        request terakhir membawa semua record_key run ini (keep) agar hanya baris lain yang dihapus.
+        """
+        insert_chunks = self.chunks(inserts)
+        update_chunks = self.chunks(updates)
+        if len(insert_chunks) + len(update_chunks) <= 1:
+            payloads = [(len(inserts) + len(updates), delta_payload(
+                insert_chunks[0][1] if insert_chunks else '[]',
+                update_chunks[0][1] if update_chunks else '[]',
+                deletes, replace
+            ))]
+        else:
+            keep = [item['record_key'] for item in itertools.chain(inserts, updates)] if replace else None
+            payloads = [(count, delta_payload(inserts=records_json)) for count, records_json in insert_chunks]
+            payloads += [(count, delta_payload(updates=records_json)) for count, records_json in update_chunks]
+            payloads.append((len(deletes), delta_payload(deletes=deletes, replace=replace, keep=keep)))
+
+        started = time.perf_counter()
+        sent = self.client.run(self._upload(payloads, method='PATCH', last=True))
+        return self._report(payloads, sent, started)
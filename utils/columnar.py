@@ -0,0 +1,80 @@
+import os
+
+from utils.pipeline import Sink
+from utils.records import FIELDS, ScholarshipBatch
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Kolom dengan sedikit nilai unik disimpan dictionary-encoded (indeks int32 + kamus string)
+DICTIONARY_FIELDS = ('kategori', 'website_sumber')
+
+
+def parquet_available():
+    """True jika pyarrow terpasang"""
+    return pa is not None
+
+
+def arrow_schema():
+    """Schema Arrow record beasiswa: semua kolom string, kolom berulang sebagai dictionary"""
+    return pa.schema([
+        pa.field(field, pa.dictionary(pa.int32(), pa.string()) if field in DICTIONARY_FIELDS else pa.string())
+        for field in FIELDS
+    ])
+
+
+class ParquetSink(Sink):
+    """Snapshot kolumnar (Parquet, kompresi zstd) yang ditulis per row group
+
+    Record ditampung per kolom sampai row_group_size lalu ditulis sebagai satu row group,
+    jadi memori dibatasi ukuran row group. Pembaca bisa memuat hanya kolom yang dibutuhkan,
+    misal pq.read_table(path, columns=['kategori'], memory_map=True).
+    """
+
+    def __init__(self, filename, directory='data', row_group_size=10000, compression='zstd'):
+        self.filename = filename
+        self.filepath = os.path.join(directory, filename)
+        self.name = filename
+        self.row_group_size = max(1, row_group_size)
+        self.compression = compression
+        self.count = 0
+        self._schema = None
+        self._writer = None
+        self._batch = ScholarshipBatch()
+
+    def open(self):
+        if pa is None:
+            raise RuntimeError("pyarrow tidak tersedia, install pyarrow untuk ekspor Parquet")
+        os.makedirs(os.path.dirname(self.filepath) or '.', exist_ok=True)
+        self._schema = arrow_schema()
+        self._writer = pq.ParquetWriter(
+            self.filepath + '.tmp', self._schema, compression=self.compression,
+            use_dictionary=list(DICTIONARY_FIELDS)
+        )
+
+    def write(self, record, status=None):
+        self._batch.append(record)
+        self.count += 1
+        if len(self._batch) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._batch:
+            return
+        table = pa.Table.from_pydict(self._batch.columns, schema=self._schema)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self._batch = ScholarshipBatch()
+
+    def close(self):
+        if self._writer is None:
+            return False
+        self._flush()
+        self._writer.close()
+        self._writer = None
+        os.replace(self.filepath + '.tmp', self.filepath)
+        print(f"Data disimpan ke {self.filepath}")
+        return True
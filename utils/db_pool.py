@@ -0,0 +1,135 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from utils.settings import env_float, env_int
+
+try:
+    import psycopg2
+    from psycopg2.pool import ThreadedConnectionPool
+except ImportError:
+    psycopg2 = None
+    ThreadedConnectionPool = None
+
+
+class DatabasePool:
+    """Pool koneksi PostgreSQL per proses di atas psycopg2 ThreadedConnectionPool
+
+    Koneksi TLS ke Postgres serverless mahal, jadi koneksi dipakai ulang antar request.
+    Saat dipinjam, koneksi yang menganggur lebih lama dari max_idle ditutup dan diganti
+    (server biasanya sudah memutusnya), dan koneksi yang menganggur lebih lama dari
+    health_check dicek dulu dengan SELECT 1. Peminjam menunggu jika semua koneksi terpakai.
+    """
+
+    def __init__(self, dsn, minconn=1, maxconn=5, max_idle=300.0, health_check=30.0, connect_timeout=10):
+        self.dsn = dsn
+        self.minconn = max(0, minconn)
+        self.maxconn = max(1, maxconn, self.minconn)
+        self.max_idle = max_idle
+        self.health_check = health_check
+        self.counters = {'checkouts': 0, 'waits': 0, 'recycled': 0, 'health_failures': 0}
+        self._pool = ThreadedConnectionPool(self.minconn, self.maxconn, dsn, connect_timeout=connect_timeout)
+        self._slots = threading.BoundedSemaphore(self.maxconn)
+        self._lock = threading.Lock()
+        self._idle_since = {}
+        self._in_use = 0
+
+    @classmethod
+    def from_env(cls):
+        """Buat pool dari DATABASE_URL, SCRAPER_DB_POOL_MIN, SCRAPER_DB_POOL_MAX, SCRAPER_DB_POOL_MAX_IDLE"""
+        return cls(
+            os.getenv('DATABASE_URL'),
+            minconn=env_int('SCRAPER_DB_POOL_MIN', 1),
+            maxconn=env_int('SCRAPER_DB_POOL_MAX', 5),
+            max_idle=env_float('SCRAPER_DB_POOL_MAX_IDLE', 300.0),
+            health_check=env_float('SCRAPER_DB_POOL_HEALTH_CHECK', 30.0),
+        )
+
+    def _checkout(self):
+        """Pinjam koneksi sehat dari pool, ganti koneksi yang kedaluwarsa atau putus"""
+        while True:
+            conn = self._pool.getconn()
+            idle = time.monotonic() - self._idle_since.pop(id(conn), time.monotonic())
+
+            if conn.closed or idle > self.max_idle:
+                self._discard(conn, 'recycled')
+                continue
+            if idle > self.health_check:
+                try:
+                    with conn.cursor() as cursor:
+                        cursor.execute('SELECT 1')
+                    conn.rollback()
+                except psycopg2.Error:
+                    self._discard(conn, 'health_failures')
+                    continue
+            return conn
+
+    def _discard(self, conn, reason):
+        with self._lock:
+            self.counters[reason] += 1
+        self._pool.putconn(conn, close=True)
+
+    @contextmanager
+    def connection(self):
+        """Pinjam satu koneksi; transaksi di-commit jika blok selesai, di-rollback jika error"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.counters['waits'] += 1
+            self._slots.acquire()
+
+        conn = None
+        try:
+            conn = self._checkout()
+            with self._lock:
+                self.counters['checkouts'] += 1
+                self._in_use += 1
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                if not conn.closed:
+                    conn.rollback()
+                raise
+        finally:
+            if conn is not None:
+                with self._lock:
+                    self._in_use -= 1
+                if conn.closed:
+                    self._pool.putconn(conn, close=True)
+                else:
+                    self._idle_since[id(conn)] = time.monotonic()
+                    self._pool.putconn(conn)
+            self._slots.release()
+
+    def stats(self):
+        """Utilisasi pool: ukuran, koneksi terpakai/menganggur dan counter peminjaman"""
+        with self._lock:
+            stats = dict(self.counters)
+            # psycopg2 tidak punya API publik untuk jumlah koneksi menganggur di pool
+            stats.update(min=self.minconn, max=self.maxconn, in_use=self._in_use, idle=len(self._pool._pool))
+        return stats
+
+    def close(self):
+        """Tutup semua koneksi pool"""
+        self._pool.closeall()
+
+
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+
+def get_db_pool():
+    """Pool koneksi database tunggal untuk seluruh proses, None jika psycopg2 atau DATABASE_URL tidak ada"""
+    global _db_pool
+    with _db_pool_lock:
+        if _db_pool is None and psycopg2 is not None and os.getenv('DATABASE_URL'):
+            _db_pool = DatabasePool.from_env()
+        return _db_pool
+
+
+def db_pool_stats():
+    """Statistik pool yang sudah dibuat, None jika belum ada (tidak membuka koneksi baru)"""
+    with _db_pool_lock:
+        pool = _db_pool
+    return pool.stats() if pool else None
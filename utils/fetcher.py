@@ -0,0 +1,172 @@
+import asyncio
+import codecs
+import os
+import re
+
+from utils.http_cache import get_validator_cache
+from utils.http_client import get_http_client
+from utils.page_needs import closing_markers, normalize_needs
+from utils.rate_limiter import get_host, get_rate_limiter
+from utils.retry import classify_error, get_circuit_breaker, get_retry_policy
+from utils.run_memo import get_run_memo
+from utils.settings import env_int
+from utils.user_agents import random_user_agent, user_agent_for
+
+# Ukuran potongan body yang dibaca per iterasi saat streaming
+CHUNK_SIZE = 16 * 1024
+META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+
+class AsyncFetcher:
+    """Engine fetch asinkron berbasis aiohttp dengan batas konkurensi global
+
+    Semua coroutine berjalan di event loop HttpClient bersama, sehingga koneksi
+    keep-alive dan batas konkurensi dibagi oleh semua scraper dalam proses.
+    """
+
+    def __init__(self, client=None, rate_limiter=None, http_cache=None, retry_policy=None,
+                 circuit_breaker=None):
+        self.client = client or get_http_client()
+        self.max_bytes = env_int('SCRAPER_MAX_BYTES', 2 * 1024 * 1024)
+        # 'host': User-Agent tetap per host, 'request': User-Agent acak per request
+        self.ua_rotation = os.getenv('SCRAPER_UA_ROTATION', 'host')
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.http_cache = http_cache or get_validator_cache()
+        self.page_store = self.http_cache.page_store
+        self.retry_policy = retry_policy or get_retry_policy()
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker()
+
+    async def fetch(self, url, delay=True, consumer=None, needs=None):
+        """Mengambil satu halaman, URL yang sudah diambil di run ini tidak di-download ulang"""
+        future, owner = get_run_memo().claim((url, needs), consumer)
+        if not owner:
+            return await asyncio.wrap_future(future)
+
+        html = None
+        try:
+            html = await self._fetch_uncached(url, delay, needs)
+        finally:
+            future.set_result(html)
+        return html
+
+    async def _fetch_uncached(self, url, delay, needs):
+        """Mengambil satu halaman dengan retry, circuit breaker, rate limiter per host dan semaphore global"""
+        # Halaman yang masih segar di page store tidak perlu ke jaringan
+        cached = self.page_store.get(url, needs=needs)
+        if cached is not None:
+            return cached
+
+        host = get_host(url)
+        attempt = 0
+        while True:
+            if not self.circuit_breaker.allow(host):
+                print(f"[WARNING] Host {host} sedang gagal terus, skip {url}")
+                return None
+
+            attempt += 1
+            try:
+                # Tunggu giliran host di luar semaphore agar slot tidak terpakai untuk tidur
+                if delay:
+                    await self.rate_limiter.wait_async(url)
+
+                async with self.client.semaphore:
+                    html = await self._download(url, needs)
+                self.circuit_breaker.record_success(host)
+                return html
+            except Exception as e:
+                retryable, retry_after = classify_error(e)
+                if not retryable:
+                    # Host tetap merespons (misal 404), bukan alasan membuka breaker
+                    self.circuit_breaker.record_success(host)
+                    print(f"Error mengambil halaman {url}: {str(e)}")
+                    return None
+
+                self.circuit_breaker.record_failure(host)
+                wait = self.retry_policy.backoff(attempt, retry_after)
+                if wait is None:
+                    print(f"Error mengambil halaman {url} setelah {attempt} percobaan: {str(e)}")
+                    return None
+
+                self.circuit_breaker.record_retry(host)
+                print(f"[WARNING] Gagal mengambil {url} ({str(e) or type(e).__name__}), "
+                      f"coba lagi dalam {wait:.1f} detik")
+                await asyncio.sleep(wait)
+
+    async def _download(self, url, needs):
+        """Download dengan conditional request, 304 dilayani dari cache validator"""
+        session = await self.client.session()
+        user_agent = random_user_agent() if self.ua_rotation == 'request' else user_agent_for(url)
+        for headers in (self.http_cache.conditional_headers(url, needs), {}):
+            headers['User-Agent'] = user_agent
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    cached = self.http_cache.load(url, needs)
+                    if cached is not None:
+                        return cached
+                    # Body cache hilang, ulangi tanpa validator
+                    continue
+
+                response.raise_for_status()
+                html, partial = await self._read_body(response, needs)
+                self.http_cache.store(url, response.headers, html, partial=partial)
+                return html
+        return None
+
+    async def _read_body(self, response, needs):
+        """Baca body secara streaming per potongan, berhenti jika tag yang dibutuhkan
+        sudah lengkap atau batas max_bytes tercapai; kembalikan (html, partial)"""
+        pending = closing_markers(needs)
+        chunks = []
+        size = 0
+        tail = b''
+        partial = False
+
+        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+
+            if pending:
+                # Sertakan ekor potongan sebelumnya agar penanda yang terbelah tetap terdeteksi
+                window = tail + chunk
+                pending = {marker for marker in pending if not marker.search(window)}
+                tail = window[-64:]
+                if not pending:
+                    partial = not response.content.at_eof()
+                    break
+
+            if size >= self.max_bytes:
+                partial = True
+                print(f"[WARNING] Body {response.url} melebihi {self.max_bytes} byte, dipotong")
+                break
+
+        body = b''.join(chunks)[:self.max_bytes]
+        return body.decode(self._guess_encoding(response, body), errors='replace'), partial
+
+    def _guess_encoding(self, response, body):
+        """Tentukan encoding dari header Content-Type, tag <meta charset>, atau default utf-8"""
+        encoding = response.charset
+        if not encoding:
+            match = META_CHARSET.search(body[:4096])
+            if match:
+                encoding = match.group(1).decode('ascii')
+        try:
+            return codecs.lookup(encoding or 'utf-8').name
+        except LookupError:
+            return 'utf-8'
+
+    async def fetch_all(self, urls, delay=True, consumer=None, needs=None):
+        """Mengambil banyak halaman sekaligus, hasil berupa dict url -> html
+
+        needs: daftar tag (misal ('h1', 'p')) yang cukup untuk pemanggil; download
+        dihentikan begitu semua tag itu lengkap. None berarti halaman penuh.
+        """
+        needs = normalize_needs(needs)
+        # Hilangkan URL duplikat tetapi pertahankan urutan
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return {}
+
+        results = await asyncio.gather(
+            *(self.fetch(url, delay, consumer, needs) for url in unique_urls)
+        )
+        return dict(zip(unique_urls, results))
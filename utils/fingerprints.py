@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from utils.records import FIELDS
+
+NEW = 'new'
+CHANGED = 'changed'
+UNCHANGED = 'unchanged'
+GONE = 'gone'
+STATUSES = (NEW, CHANGED, UNCHANGED, GONE)
+
+# Field yang ikut dibandingkan; tanggal_update selalu berubah tiap run
+CONTENT_FIELDS = tuple(field for field in FIELDS if field != 'tanggal_update')
+
+
+def _sha256(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def content_hash(values):
+    """Hash konten record yang sudah dinormalisasi (whitespace dirapikan)"""
+    normalized = [' '.join(str(values.get(field) or '').split()) for field in CONTENT_FIELDS]
+    return _sha256(json.dumps(normalized, ensure_ascii=False))
+
+
+class FingerprintStore:
+    """Sidik jari per sumber: hash halaman mentah dan hash konten hasil ekstraksi
+
+    Halaman dengan hash sama (dan aturan registry yang sama) tidak perlu diekstrak ulang,
+    dan hash konten menentukan apakah record sumber baru, berubah, tetap atau hilang.
+    """
+
+    def __init__(self, path='data/fingerprints.json'):
+        self.path = path
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries = self._load()
+
+    @classmethod
+    def from_env(cls):
+        """Buat store dari SCRAPER_FINGERPRINTS"""
+        return cls(path=os.getenv('SCRAPER_FINGERPRINTS', 'data/fingerprints.json'))
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def page_hash(self, spec, url, html):
+        """Hash halaman mentah beserta URL dan aturan ekstraksi sumber (spec)"""
+        digest = hashlib.sha256(json.dumps([spec, url], ensure_ascii=False, sort_keys=True).encode('utf-8'))
+        digest.update(html.encode('utf-8'))
+        return digest.hexdigest()
+
+    def content_hash(self, values):
+        """Hash konten record yang sudah dinormalisasi (whitespace dirapikan)"""
+        return content_hash(values)
+
+    def unchanged_values(self, source_id, page_hash):
+        """Nilai record tersimpan jika halaman sumber tidak berubah, None jika perlu ekstraksi"""
+        with self._lock:
+            entry = self._entries.get(source_id)
+            if entry and page_hash and entry.get('page_hash') == page_hash:
+                return dict(entry['values'])
+        return None
+
+    def update(self, source_id, category, page_hash, values):
+        """Simpan sidik jari terbaru sumber dan kembalikan statusnya (new/changed/unchanged)"""
+        content_hash = self.content_hash(values)
+        with self._lock:
+            entry = self._entries.get(source_id)
+            if entry is None:
+                status = NEW
+            elif entry['content_hash'] != content_hash:
+                status = CHANGED
+            else:
+                status = UNCHANGED
+
+            self._entries[source_id] = {
+                'category': category,
+                'page_hash': page_hash,
+                'content_hash': content_hash,
+                'values': {field: values.get(field) for field in CONTENT_FIELDS},
+                'seen_at': time.time(),
+            }
+            self._count(category, status)
+            self._dirty = True
+        return status
+
+    def finish(self, seen_ids, categories, keep_ids=()):
+        """Tandai sumber yang tidak menghasilkan record di run ini sebagai hilang
+
+        Hanya sumber di kategori yang dijalankan yang diperiksa; keep_ids (misal sumber yang
+        sengaja dilewati lewat filter) tidak dianggap hilang. Kembalikan list (id, kategori, values).
+        """
+        gone = []
+        with self._lock:
+            for source_id, entry in list(self._entries.items()):
+                if entry['category'] not in categories or source_id in seen_ids or source_id in keep_ids:
+                    continue
+                gone.append((source_id, entry['category'], entry['values']))
+                del self._entries[source_id]
+                self._count(entry['category'], GONE)
+                self._dirty = True
+        return gone
+
+    def _count(self, category, status):
+        """Tambah counter status per kategori (lock harus sudah dipegang)"""
+        counts = self.counters.setdefault(category, dict.fromkeys(STATUSES, 0))
+        counts[status] += 1
+
+    def stats(self):
+        """Jumlah sumber baru/berubah/tetap/hilang per kategori untuk run ini"""
+        with self._lock:
+            return {category: dict(counts) for category, counts in self.counters.items()}
+
+    def reset_stats(self):
+        """Mulai hitungan run baru"""
+        with self._lock:
+            self.counters = {}
+
+    def save(self):
+        """Tulis store ke disk jika ada perubahan"""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = {source_id: dict(entry) for source_id, entry in self._entries.items()}
+            self._dirty = False
+
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[WARNING] Gagal menyimpan fingerprint store: {e}")
+
+
+_fingerprint_store = None
+_fingerprint_store_lock = threading.Lock()
+
+
+def get_fingerprint_store():
+    """Fingerprint store tunggal untuk seluruh proses
+
+    Sengaja tidak disimpan otomatis saat proses selesai: store hanya disimpan setelah run
+    berhasil agar perubahan dari run yang gagal tidak dianggap sudah terkirim.
+    """
+    global _fingerprint_store
+    with _fingerprint_store_lock:
+        if _fingerprint_store is None:
+            _fingerprint_store = FingerprintStore.from_env()
+        return _fingerprint_store
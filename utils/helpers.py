@@ -1,72 +1,133 @@
-import requests
-import time
-import random
-from fake_useragent import UserAgent
-from bs4 import BeautifulSoup
 import json
 from datetime import datetime
 import os
 import csv
+from utils.fetcher import AsyncFetcher
+from utils.http_cache import get_validator_cache
+from utils.http_client import get_http_client
+from utils.parse_pool import get_parse_pool
+from utils.parsers import element_text, get_parser_backend, normalize_only
+from utils.rate_limiter import get_rate_limiter
+from utils.records import FIELDS, ScholarshipBatch
+from utils.retry import get_circuit_breaker
+from utils.run_memo import get_run_memo
+from utils.xlsx_writer import XlsxWriter
 
 class WebScraperHelper:
-    def __init__(self):
-        self.ua = UserAgent()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-    
-    def get_page(self, url, delay=True):
-        """Mengambil halaman web dengan delay random untuk menghindari blocking"""
-        try:
-            if delay:
-                time.sleep(random.uniform(1, 3))
-            
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return response.text
-        except Exception as e:
-            print(f"Error mengambil halaman {url}: {str(e)}")
-            return None
-    
-    def parse_html(self, html_content):
-        """Parse HTML content dengan BeautifulSoup"""
+    def __init__(self, needs=None):
+        # Tag yang dibutuhkan scraper dari setiap halaman: download dihentikan begitu lengkap
+        # dan parse_html hanya membangun subtree tag tersebut
+        self.needs = needs
+        # Transport HTTP, rate limiter dan cache dibagi oleh semua helper dalam proses
+        self.client = get_http_client()
+        self.rate_limiter = get_rate_limiter()
+        self.http_cache = get_validator_cache()
+        self.page_store = self.http_cache.page_store
+        self.fetcher = AsyncFetcher(
+            client=self.client,
+            rate_limiter=self.rate_limiter,
+            http_cache=self.http_cache,
+        )
+    
+    def get_page(self, url, delay=True, needs=None):
+        """Mengambil satu halaman web lewat engine fetch (jeda per host, cache, retry)"""
+        return self.prefetch([url], delay=delay, needs=needs).get(url)
+    
+    async def get_pages(self, urls, delay=True, needs=None):
+        """Mengambil banyak halaman secara konkuren, hasil berupa dict url -> html"""
+        return await self.client.wrap(self._fetch_all(urls, delay, needs))
+    
+    def prefetch(self, urls, delay=True, needs=None):
+        """Versi sinkron dari get_pages untuk dipanggil dari scrape_all"""
+        return self.client.run(self._fetch_all(urls, delay, needs))
+    
+    def _fetch_all(self, urls, delay, needs):
+        """Coroutine fetch batch untuk dijalankan di event loop klien HTTP bersama"""
+        return self.fetcher.fetch_all(urls, delay=delay, consumer=id(self), needs=needs or self.needs)
+    
+    def set_host_delay(self, host, seconds):
+        """Atur jeda sopan khusus untuk satu host (atau URL)"""
+        self.rate_limiter.set_delay(host, seconds)
+    
+    def get_throttle_stats(self):
+        """Statistik throttling per host dari rate limiter"""
+        return self.rate_limiter.stats()
+    
+    def get_cache_stats(self):
+        """Statistik cache validator HTTP (hit, miss, revalidasi)"""
+        return self.http_cache.stats()
+    
+    def get_page_store_stats(self):
+        """Statistik page store lokal (hit, stale, miss, evicted, ukuran)"""
+        return self.page_store.stats()
+    
+    def get_breaker_stats(self):
+        """Status circuit breaker dan jumlah retry per host"""
+        return get_circuit_breaker().stats()
+    
+    def get_pool_stats(self):
+        """Statistik connection pool bersama (koneksi baru vs dipakai ulang)"""
+        return self.client.stats()
+    
+    def get_parse_stats(self):
+        """Statistik pool parsing (jumlah worker, halaman di-parse di proses vs thread)"""
+        return get_parse_pool().stats()
+    
+    def get_memo_stats(self):
+        """Statistik fetch/parse duplikat yang dihindari dalam run ini"""
+        return get_run_memo().stats()
+    
+    def parse_html(self, html_content, backend=None, only=None):
+        """Parse HTML content dengan backend parser tercepat yang tersedia (selectolax, lxml,
+        atau html.parser; bisa dipaksa lewat SCRAPER_PARSER), hasil parse dibagi antar scraper dalam satu run
+        Parse parsial memakai backend tercepat yang mendukungnya (lxml atau html.parser)
+
+        only berisi tag/selector yang dibutuhkan (default: needs helper), sehingga hanya
+        subtree tersebut yang dibangun. Gunakan only=() untuk memaksa parse penuh.
+        """
         if html_content:
-            return BeautifulSoup(html_content, 'html.parser')
+            only = normalize_only(self.needs if only is None else only)
+            parser = get_parser_backend(backend, partial=only is not None)
+            only = only if parser.supports_only else None
+            memo = get_run_memo()
+            soup = memo.get_soup(html_content, key=(parser.name, only))
+            if soup is None:
+                soup = parser.parse(html_content, only=only)
+                memo.put_soup(html_content, soup, key=(parser.name, only))
+            return soup
         return None
     
     def extract_text(self, element):
         """Ekstrak teks dari elemen HTML dengan pembersihan"""
-        if element:
-            text = element.get_text(strip=True)
-            return ' '.join(text.split()) if text else ""
-        return ""
+        return element_text(element)
     
     def save_to_json(self, data, filename):
         """Simpan data ke file JSON"""
         os.makedirs('data', exist_ok=True)
         filepath = os.path.join('data', filename)
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            if isinstance(data, ScholarshipBatch):
+                # Ditulis langsung dari kolom, tanpa membangun dict per record
+                data.write_json(f, indent=2)
+            else:
+                json.dump(data, f, ensure_ascii=False, indent=2)
         print(f"Data disimpan ke {filepath}")
     
     def save_to_excel(self, data, filename):
-        """Simpan data ke file Excel (tanpa pandas)"""
-        try:
-            # Try to use pandas if available
-            import pandas as pd
-            os.makedirs('data', exist_ok=True)
-            filepath = os.path.join('data', filename)
-            df = pd.DataFrame(data)
-            df.to_excel(filepath, index=False)
-            print(f"Data disimpan ke {filepath}")
-        except ImportError:
-            print(f"⚠️ pandas tidak tersedia, skip save to Excel: {filename}")
+        """Simpan data ke file Excel (tanpa pandas), baris di-stream langsung ke file .xlsx"""
+        filepath = os.path.join('data', filename)
+        with XlsxWriter(filepath) as writer:
+            if isinstance(data, ScholarshipBatch):
+                writer.write_row(FIELDS, bold=True)
+                for row in data.rows():
+                    writer.write_row(row)
+            elif data:
+                # Kolom mengikuti key item pertama, seperti DataFrame dari list dict
+                fieldnames = list(data[0].keys())
+                writer.write_row(fieldnames, bold=True)
+                for item in data:
+                    writer.write_row([item.get(field) for field in fieldnames])
+        print(f"Data disimpan ke {filepath}")
     
     def save_to_csv(self, data, filename):
         """Simpan data ke file CSV (tanpa pandas)"""
@@ -77,13 +138,18 @@ class WebScraperHelper:
             print(f"⚠️ Tidak ada data untuk disimpan ke CSV: {filename}")
             return
         
-        # Get fieldnames from first item
-        fieldnames = list(data[0].keys())
-        
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+            if isinstance(data, ScholarshipBatch):
+                # Baris dibaca langsung dari kolom batch
+                writer = csv.writer(f)
+                writer.writerow(FIELDS)
+                writer.writerows(data.rows())
+            else:
+                # Get fieldnames from first item
+                fieldnames = list(data[0].keys())
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(data)
         
         print(f"Data disimpan ke {filepath}")
     
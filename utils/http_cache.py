@@ -0,0 +1,111 @@
+import atexit
+import json
+import os
+import threading
+
+from utils.page_store import get_page_store
+
+
+class ValidatorCache:
+    """Cache validator HTTP (ETag / Last-Modified) persisten di disk untuk conditional request
+
+    Body halaman disimpan di PageStore, cache ini hanya menyimpan validatornya.
+    """
+
+    def __init__(self, directory='data/http_cache', page_store=None):
+        self.directory = directory
+        self.page_store = page_store or get_page_store()
+        self.index_path = os.path.join(directory, 'index.json')
+        self.counters = {'hits': 0, 'misses': 0, 'revalidations': 0}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries = self._load_index()
+
+    def _load_index(self):
+        """Muat index validator dari disk, kosong jika belum ada atau rusak"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def conditional_headers(self, url, needs=None):
+        """Header If-None-Match / If-Modified-Since untuk URL yang sudah pernah diambil"""
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry or not self.page_store.has(url, needs):
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        if headers:
+            with self._lock:
+                self.counters['revalidations'] += 1
+        return headers
+
+    def load(self, url, needs=None):
+        """Ambil body tersimpan setelah server menjawab 304 Not Modified"""
+        body = self.page_store.get_stale(url, needs)
+        if body is None:
+            return None
+
+        self.page_store.touch(url)
+        with self._lock:
+            self.counters['hits'] += 1
+        return body
+
+    def store(self, url, headers, body, partial=False):
+        """Simpan validator dan body dari response 200"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        self.page_store.put(url, body, partial=partial)
+
+        with self._lock:
+            self.counters['misses'] += 1
+            if not etag and not last_modified:
+                # Server tidak mendukung revalidasi, cukup body di page store
+                if self._entries.pop(url, None) is not None:
+                    self._dirty = True
+                return
+            self._entries[url] = {'etag': etag, 'last_modified': last_modified}
+            self._dirty = True
+
+    def save(self):
+        """Tulis index validator ke disk jika ada perubahan"""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self._entries)
+            self._dirty = False
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"[WARNING] Gagal menyimpan index cache HTTP: {e}")
+
+    def stats(self):
+        """Jumlah hit (304), miss (download penuh) dan revalidasi yang dikirim"""
+        with self._lock:
+            return dict(self.counters)
+
+
+_validator_cache = None
+_validator_cache_lock = threading.Lock()
+
+
+def get_validator_cache():
+    """Cache validator tunggal untuk seluruh proses, disimpan otomatis saat proses selesai"""
+    global _validator_cache
+    with _validator_cache_lock:
+        if _validator_cache is None:
+            _validator_cache = ValidatorCache(os.getenv('SCRAPER_HTTP_CACHE_DIR', 'data/http_cache'))
+            atexit.register(_validator_cache.save)
+        return _validator_cache
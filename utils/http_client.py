@@ -0,0 +1,190 @@
+import asyncio
+import atexit
+import json
+import threading
+
+import aiohttp
+
+from utils.settings import env_float, env_int
+from utils.user_agents import random_user_agent
+
+DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+class HttpResponse:
+    """Response sederhana yang sudah dibaca penuh, dengan atribut mirip requests"""
+
+    def __init__(self, status_code, headers, content, encoding=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class HttpClient:
+    """Klien HTTP tunggal per proses: satu event loop di thread latar dan satu
+    aiohttp ClientSession dengan connection pool yang dibagi semua scraper dan upload database"""
+
+    def __init__(self, headers=None, limit=100, limit_per_host=4, keepalive_timeout=30.0,
+                 connect_timeout=10.0, read_timeout=20.0, max_concurrency=8):
+        self.headers = dict(DEFAULT_HEADERS)
+        self.headers['User-Agent'] = random_user_agent()
+        self.headers.update(headers or {})
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_concurrency = max_concurrency
+        self.counters = {'requests': 0, 'opened': 0, 'reused': 0}
+
+        self._session = None
+        self._semaphore = None
+        self._counter_lock = threading.Lock()
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name='http-client', daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_env(cls):
+        """Buat klien dari SCRAPER_POOL_SIZE, SCRAPER_POOL_PER_HOST, SCRAPER_KEEPALIVE, timeout dan konkurensi"""
+        return cls(
+            limit=env_int('SCRAPER_POOL_SIZE', 100),
+            limit_per_host=env_int('SCRAPER_POOL_PER_HOST', 4),
+            keepalive_timeout=env_float('SCRAPER_KEEPALIVE', 30.0),
+            connect_timeout=env_float('SCRAPER_CONNECT_TIMEOUT', 10.0),
+            read_timeout=env_float('SCRAPER_READ_TIMEOUT', 20.0),
+            max_concurrency=env_int('SCRAPER_CONCURRENCY', 8),
+        )
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _count(self, key):
+        with self._counter_lock:
+            self.counters[key] += 1
+
+    def _trace_config(self):
+        """Trace aiohttp untuk menghitung koneksi baru vs koneksi keep-alive yang dipakai ulang"""
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            self._count('requests')
+
+        async def on_connection_create_end(session, context, params):
+            self._count('opened')
+
+        async def on_connection_reuseconn(session, context, params):
+            self._count('reused')
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace
+
+    async def session(self):
+        """ClientSession bersama (dibuat sekali di event loop klien)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            # total membatasi seluruh request (server yang mengirim byte sangat lambat tidak
+            # menahan koneksi pool selamanya), sama dengan timeout 30 detik requests sebelumnya
+            timeout = aiohttp.ClientTimeout(
+                total=self.connect_timeout + self.read_timeout,
+                sock_connect=self.connect_timeout,
+                sock_read=self.read_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=timeout,
+                trace_configs=[self._trace_config()],
+            )
+        return self._session
+
+    @property
+    def semaphore(self):
+        """Semaphore global pembatas jumlah download bersamaan (hanya dipakai di event loop klien)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def submit(self, coro):
+        """Jadwalkan coroutine di event loop klien, kembalikan concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout=None):
+        """Jalankan coroutine di event loop klien dan tunggu hasilnya (blocking)"""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("HttpClient.run tidak boleh dipanggil dari event loop klien, gunakan await")
+        return self.submit(coro).result(timeout)
+
+    async def wrap(self, coro):
+        """Await coroutine klien dari event loop mana pun"""
+        return await asyncio.wrap_future(self.submit(coro))
+
+    async def request(self, method, url, timeout=None, **kwargs):
+        """Kirim request lewat pool bersama dan baca body penuh"""
+        session = await self.session()
+        if timeout is not None:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout, sock_connect=self.connect_timeout)
+        async with session.request(method, url, **kwargs) as response:
+            content = await response.read()
+            return HttpResponse(response.status, response.headers, content, response.charset)
+
+    def request_sync(self, method, url, timeout=None, **kwargs):
+        """Versi blocking dari request()"""
+        return self.run(self.request(method, url, timeout=timeout, **kwargs))
+
+    def stats(self):
+        """Statistik pool: jumlah request, koneksi baru dan koneksi yang dipakai ulang"""
+        with self._counter_lock:
+            return dict(self.counters)
+
+    async def _close_session(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def close(self):
+        """Tutup session dan hentikan event loop klien"""
+        if self.loop.is_closed():
+            return
+        try:
+            self.run(self._close_session(), timeout=5)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client():
+    """Klien HTTP tunggal untuk seluruh proses, ditutup otomatis saat proses selesai"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HttpClient.from_env()
+            atexit.register(_http_client.close)
+        return _http_client
@@ -0,0 +1,43 @@
+import re
+
+# Nama tag di awal selector sederhana, misal 'div' dari 'div.content > p'
+_SELECTOR_TAG = re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)')
+
+
+def normalize_needs(needs):
+    """Normalisasi daftar tag/selector yang dibutuhkan menjadi tuple nama tag terurut
+
+    None berarti butuh halaman penuh, termasuk jika ada selector tanpa nama tag
+    (misal '.judul' atau '*') karena elemennya tidak bisa ditentukan dari tag.
+    """
+    if not needs:
+        return None
+    if isinstance(needs, str):
+        needs = (needs,)
+    tags = set()
+    for selector in needs:
+        selector = selector.strip()
+        if not selector:
+            continue
+        match = _SELECTOR_TAG.match(selector)
+        if not match:
+            return None
+        tags.add(match.group(1).lower())
+    return tuple(sorted(tags)) or None
+
+
+def _closing_tag(tag):
+    """Regex tag penutup utuh; '</p' saja juga cocok dengan </path>, </pre> atau </picture>"""
+    return rf"</{re.escape(tag)}\s*>"
+
+
+def closing_markers(needs):
+    """Pola tag penutup (regex bytes, tanpa beda huruf besar/kecil) yang menandakan elemen sudah lengkap diterima"""
+    return {re.compile(_closing_tag(tag).encode('ascii'), re.IGNORECASE) for tag in (needs or ())}
+
+
+def has_needs(html, needs):
+    """Apakah HTML (bisa terpotong) sudah memuat semua elemen yang dibutuhkan"""
+    if not needs:
+        return False
+    return all(re.search(_closing_tag(tag), html, re.IGNORECASE) for tag in needs)
@@ -0,0 +1,246 @@
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+
+from utils.page_needs import has_needs
+from utils.rate_limiter import get_host
+from utils.settings import env_float, env_int, lookup_host, parse_host_map
+
+
+class PageStore:
+    """Penyimpanan halaman HTML terkompresi (zlib), content-addressed, dengan TTL dan eviksi LRU
+
+    Halaman yang di-download terpotong (streaming dengan early termination) ditandai
+    partial dan hanya dipakai ulang jika memuat semua tag yang dibutuhkan pemanggil.
+    """
+
+    def __init__(self, directory='data/page_store', max_bytes=50 * 1024 * 1024,
+                 default_ttl=6 * 3600, host_ttls=None):
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, 'objects')
+        self.index_path = os.path.join(directory, 'index.json')
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.host_ttls = dict(host_ttls or {})
+        self.counters = {'hits': 0, 'stale': 0, 'misses': 0, 'evicted': 0}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries = self._load_index()
+
+    @classmethod
+    def from_env(cls):
+        """Buat page store dari SCRAPER_PAGE_STORE_DIR, SCRAPER_PAGE_STORE_MAX_MB, SCRAPER_PAGE_TTL(S)"""
+        return cls(
+            directory=os.getenv('SCRAPER_PAGE_STORE_DIR', 'data/page_store'),
+            max_bytes=env_int('SCRAPER_PAGE_STORE_MAX_MB', 50) * 1024 * 1024,
+            default_ttl=env_float('SCRAPER_PAGE_TTL', 6 * 3600),
+            host_ttls=parse_host_map(os.getenv('SCRAPER_PAGE_TTLS', '')),
+        )
+
+    def _load_index(self):
+        """Muat index URL -> metadata blob dari disk"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _blob_path(self, digest):
+        """Lokasi blob terkompresi untuk hash konten"""
+        return os.path.join(self.objects_dir, f"{digest}.z")
+
+    def set_ttl(self, host, seconds):
+        """Atur TTL khusus (detik) untuk satu host/sumber"""
+        if '://' in host:
+            host = get_host(host)
+        with self._lock:
+            self.host_ttls[host.lower()] = float(seconds)
+
+    def ttl_for(self, url):
+        """TTL yang berlaku untuk URL"""
+        return lookup_host(self.host_ttls, get_host(url), self.default_ttl)
+
+    def _read_blob(self, entry):
+        """Baca dan dekompres blob, None jika hilang atau rusak"""
+        try:
+            with open(self._blob_path(entry['hash']), 'rb') as f:
+                return zlib.decompress(f.read()).decode('utf-8')
+        except (OSError, zlib.error, UnicodeDecodeError):
+            return None
+
+    def _usable(self, entry, body, needs):
+        """Body lengkap selalu bisa dipakai, body partial hanya jika memuat tag yang dibutuhkan"""
+        return not entry.get('partial') or has_needs(body, needs)
+
+    def get(self, url, ttl=None, needs=None):
+        """Ambil halaman yang masih segar (umur <= TTL), None jika tidak ada atau kedaluwarsa"""
+        ttl = self.ttl_for(url) if ttl is None else ttl
+        with self._lock:
+            entry = self._entries.get(url)
+            if not entry or time.time() - entry['stored_at'] > ttl:
+                self.counters['misses' if not entry else 'stale'] += 1
+                return None
+
+        body = self._read_blob(entry)
+        with self._lock:
+            if body is None:
+                self._forget(url)
+            if body is None or not self._usable(entry, body, needs):
+                self.counters['misses'] += 1
+                return None
+            entry['last_access'] = time.time()
+            self.counters['hits'] += 1
+            self._dirty = True
+        return body
+
+    def get_stale(self, url, needs=None):
+        """Ambil halaman tanpa memperhatikan TTL (misal untuk melayani response 304)"""
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry:
+            return None
+
+        body = self._read_blob(entry)
+        with self._lock:
+            if body is None:
+                self._forget(url)
+                return None
+            if not self._usable(entry, body, needs):
+                return None
+            entry['last_access'] = time.time()
+            self._dirty = True
+        return body
+
+    def has(self, url, needs=None):
+        """Apakah URL punya salinan yang bisa dipakai di store (segar maupun kedaluwarsa)"""
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry or not os.path.exists(self._blob_path(entry['hash'])):
+            return False
+        if not entry.get('partial'):
+            return True
+        body = self._read_blob(entry)
+        return body is not None and has_needs(body, needs)
+
+    def touch(self, url):
+        """Tandai halaman sebagai segar kembali, dipakai setelah revalidasi 304"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry:
+                entry['stored_at'] = entry['last_access'] = time.time()
+                self._dirty = True
+
+    def put(self, url, body, partial=False):
+        """Simpan halaman; blob dengan konten sama hanya disimpan sekali"""
+        data = body.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(digest)
+
+        try:
+            if not os.path.exists(blob_path):
+                os.makedirs(self.objects_dir, exist_ok=True)
+                compressed = zlib.compress(data, 6)
+                tmp_path = f"{blob_path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(compressed)
+                os.replace(tmp_path, blob_path)
+                size = len(compressed)
+            else:
+                size = os.path.getsize(blob_path)
+        except OSError as e:
+            print(f"[WARNING] Gagal menyimpan halaman {url} ke page store: {e}")
+            return
+
+        now = time.time()
+        with self._lock:
+            old = self._entries.get(url)
+            self._entries[url] = {
+                'hash': digest, 'size': size, 'stored_at': now, 'last_access': now, 'partial': partial,
+            }
+            self._dirty = True
+            if old and old['hash'] != digest:
+                self._drop_blob_if_unused(old['hash'])
+            self._evict()
+
+    def _forget(self, url):
+        """Hapus entry URL (lock harus sudah dipegang)"""
+        entry = self._entries.pop(url, None)
+        if entry:
+            self._dirty = True
+            self._drop_blob_if_unused(entry['hash'])
+
+    def _drop_blob_if_unused(self, digest):
+        """Hapus blob jika tidak ada URL lain yang memakainya (lock harus sudah dipegang)"""
+        if any(entry['hash'] == digest for entry in self._entries.values()):
+            return
+        try:
+            os.remove(self._blob_path(digest))
+        except OSError:
+            pass
+
+    def _total_bytes(self):
+        """Total ukuran blob unik di disk (lock harus sudah dipegang)"""
+        sizes = {entry['hash']: entry['size'] for entry in self._entries.values()}
+        return sum(sizes.values())
+
+    def _evict(self):
+        """Buang entry yang paling lama tidak diakses sampai ukuran di bawah batas"""
+        total = self._total_bytes()
+        if total <= self.max_bytes:
+            return
+
+        for url, entry in sorted(self._entries.items(), key=lambda item: item[1]['last_access']):
+            if total <= self.max_bytes:
+                break
+            self._entries.pop(url)
+            self.counters['evicted'] += 1
+            if not any(other['hash'] == entry['hash'] for other in self._entries.values()):
+                total -= entry['size']
+                try:
+                    os.remove(self._blob_path(entry['hash']))
+                except OSError:
+                    pass
+        self._dirty = True
+
+    def save(self):
+        """Tulis index ke disk jika ada perubahan"""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = {url: dict(entry) for url, entry in self._entries.items()}
+            self._dirty = False
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"[WARNING] Gagal menyimpan index page store: {e}")
+
+    def stats(self):
+        """Statistik hit/stale/miss/evicted serta ukuran store"""
+        with self._lock:
+            stats = dict(self.counters)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._total_bytes()
+        return stats
+
+
+_page_store = None
+_page_store_lock = threading.Lock()
+
+
+def get_page_store():
+    """Page store tunggal untuk seluruh proses, index disimpan otomatis saat proses selesai"""
+    global _page_store
+    with _page_store_lock:
+        if _page_store is None:
+            _page_store = PageStore.from_env()
+            atexit.register(_page_store.save)
+        return _page_store
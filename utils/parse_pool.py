@@ -0,0 +1,97 @@
+import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from utils.parsers import element_text, get_parser_backend
+from utils.settings import env_int
+
+
+def extract_fields(html, only, rules, backend=None):
+    """Parse HTML dan ambil teks per field dari selector CSS (dijalankan di proses worker)
+
+    Hanya dict kecil field -> teks yang dikirim balik, bukan dokumen hasil parse.
+    """
+    soup = get_parser_backend(backend).parse(html, only=only)
+    return {field: element_text(soup.select_one(selector)) for field, selector in rules}
+
+
+class ParsePool:
+    """Tahap parsing di ProcessPoolExecutor agar parse HTML (CPU-bound, memegang GIL)
+    tidak menghambat download yang sedang berjalan di event loop klien HTTP"""
+
+    def __init__(self, workers=None):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.counters = {'pages': 0, 'inline': 0}
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """Buat pool dari SCRAPER_PARSE_WORKERS (default jumlah core, 0 = parse di thread tanpa proses)"""
+        return cls(workers=env_int('SCRAPER_PARSE_WORKERS', os.cpu_count() or 1))
+
+    def _get_executor(self):
+        """Executor proses, dibuat saat pertama dipakai; None jika parse dilakukan di thread"""
+        with self._lock:
+            if self._executor is None and self.workers > 0:
+                # spawn: worker tidak mewarisi thread event loop dan koneksi milik proses utama
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def _count(self, key):
+        with self._lock:
+            self.counters[key] += 1
+
+    async def extract(self, html, only, rules):
+        """Ekstrak teks field dari HTML tanpa memblokir event loop pemanggil"""
+        loop = asyncio.get_running_loop()
+        backend = get_parser_backend(partial=bool(only)).name
+        rules = tuple(rules)
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                result = await loop.run_in_executor(executor, extract_fields, html, only, rules, backend)
+                self._count('pages')
+                return result
+            except BrokenProcessPool as e:
+                print(f"[WARNING] Pool parsing rusak ({e}), parse dilanjutkan di thread")
+                self.shutdown()
+                self.workers = 0
+
+        result = await loop.run_in_executor(None, extract_fields, html, only, rules, backend)
+        self._count('inline')
+        return result
+
+    def stats(self):
+        """Jumlah worker dan halaman yang di-parse di proses worker vs di thread"""
+        with self._lock:
+            stats = dict(self.counters)
+        stats['workers'] = self.workers
+        return stats
+
+    def shutdown(self):
+        """Hentikan proses worker"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool():
+    """Pool parsing tunggal untuk seluruh proses, dihentikan otomatis saat proses selesai"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ParsePool.from_env()
+            atexit.register(_parse_pool.shutdown)
+        return _parse_pool
@@ -0,0 +1,195 @@
+import os
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from utils.page_needs import normalize_needs
+
+# Urutan preferensi saat memilih backend otomatis (tercepat lebih dulu)
+PREFERRED_BACKENDS = ('selectolax', 'lxml', 'html.parser')
+
+
+def normalize_only(only):
+    """Ubah hint tag/selector menjadi tuple terurut, None jika harus parse penuh"""
+    if not only:
+        return None
+    if isinstance(only, str):
+        only = (only,)
+    return tuple(sorted(set(only)))
+
+
+def element_text(element):
+    """Teks elemen dengan whitespace dinormalisasi, string kosong jika elemen tidak ada"""
+    if element:
+        text = element.get_text(strip=True)
+        return ' '.join(text.split()) if text else ""
+    return ""
+
+
+def strainer_tags(only):
+    """Nama tag teratas dari hint tag/selector untuk SoupStrainer, None jika harus parse penuh"""
+    tags = normalize_needs(only)
+    return list(tags) if tags else None
+
+
+class SelectolaxNode:
+    """Adapter node selectolax/lexbor dengan API mirip Tag BeautifulSoup
+    (find, find_all, select, select_one, get_text, get) agar extractor tetap jalan"""
+
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    @staticmethod
+    def wrap(node):
+        return SelectolaxNode(node) if node is not None else None
+
+    @property
+    def name(self):
+        return self.node.tag
+
+    @property
+    def text(self):
+        return self.node.text(deep=True)
+
+    @property
+    def attrs(self):
+        return dict(self.node.attributes)
+
+    def get(self, attribute, default=None):
+        value = self.node.attributes.get(attribute)
+        return default if value is None else value
+
+    def __getitem__(self, attribute):
+        return self.node.attributes[attribute]
+
+    def get_text(self, separator='', strip=False):
+        return self.node.text(deep=True, separator=separator, strip=strip)
+
+    @staticmethod
+    def _selector(name=None, class_=None, id=None, attrs=None):
+        """Ubah argumen gaya find() BeautifulSoup menjadi CSS selector"""
+        selector = name or '*'
+        if class_:
+            selector += f".{class_}"
+        if id:
+            selector += f"#{id}"
+        for key, value in (attrs or {}).items():
+            selector += f'[{key}="{value}"]' if value is not True else f"[{key}]"
+        return selector
+
+    def find(self, name=None, class_=None, id=None, attrs=None):
+        return self.select_one(self._selector(name, class_, id, attrs))
+
+    def find_all(self, name=None, class_=None, id=None, attrs=None, limit=None):
+        nodes = self.select(self._selector(name, class_, id, attrs))
+        return nodes[:limit] if limit else nodes
+
+    def select_one(self, selector):
+        return self.wrap(self.node.css_first(selector))
+
+    def select(self, selector):
+        return [SelectolaxNode(node) for node in self.node.css(selector)]
+
+    def __bool__(self):
+        return True
+
+    def __repr__(self):
+        return self.node.html or ''
+
+
+class ParserBackend:
+    """Backend parser HTML: nama dan fungsi parse yang menghasilkan dokumen bergaya BeautifulSoup"""
+
+    def __init__(self, name, parse, available, supports_only=False):
+        self.name = name
+        self._parse = parse
+        self._available = available
+        # Apakah backend bisa membangun hanya subtree tag tertentu (parse parsial)
+        self.supports_only = supports_only
+
+    def available(self):
+        """Apakah library backend ini terpasang"""
+        try:
+            return bool(self._available())
+        except ImportError:
+            return False
+
+    def parse(self, html_content, only=None):
+        """Parse HTML menjadi dokumen dengan find/find_all/select/get_text
+
+        only berisi tag/selector yang dibutuhkan; backend yang mendukung hanya membangun
+        subtree tag tersebut, backend lain mengabaikannya dan mem-parse penuh.
+        """
+        if self.supports_only:
+            return self._parse(html_content, strainer_tags(only))
+        return self._parse(html_content)
+
+
+def _lxml_available():
+    import lxml  # noqa: F401
+    return True
+
+
+def _selectolax_available():
+    from selectolax.lexbor import LexborHTMLParser  # noqa: F401
+    return True
+
+
+def _soup_parser(features):
+    """Fungsi parse BeautifulSoup dengan SoupStrainer opsional"""
+    def parse(html_content, tags=None):
+        parse_only = SoupStrainer(tags) if tags else None
+        return BeautifulSoup(html_content, features, parse_only=parse_only)
+    return parse
+
+
+def _parse_selectolax(html_content):
+    from selectolax.lexbor import LexborHTMLParser
+    return SelectolaxNode(LexborHTMLParser(html_content).root)
+
+
+BACKENDS = {
+    'html.parser': ParserBackend(
+        'html.parser', _soup_parser('html.parser'), lambda: True, supports_only=True
+    ),
+    'lxml': ParserBackend(
+        'lxml', _soup_parser('lxml'), _lxml_available, supports_only=True
+    ),
+    'selectolax': ParserBackend(
+        'selectolax', _parse_selectolax, _selectolax_available
+    ),
+}
+
+_selected = {}
+
+
+def available_backends():
+    """Nama backend yang terpasang, urut dari yang paling cepat"""
+    return [name for name in PREFERRED_BACKENDS if BACKENDS[name].available()]
+
+
+def get_parser_backend(name=None, partial=False):
+    """Backend parser yang dipakai: nama eksplisit, SCRAPER_PARSER, atau yang tercepat yang tersedia
+
+    Dengan partial (pemanggil hanya butuh tag tertentu), mode auto memilih backend tercepat
+    yang bisa parse parsial, karena selectolax selalu membangun dokumen penuh.
+    """
+    name = name or os.getenv('SCRAPER_PARSER', 'auto')
+    partial = bool(partial) and name == 'auto'
+    if (name, partial) in _selected:
+        return _selected[(name, partial)]
+
+    if name == 'auto':
+        names = available_backends()
+        if partial:
+            names = [candidate for candidate in names if BACKENDS[candidate].supports_only]
+        backend = BACKENDS[names[0]]
+    elif name in BACKENDS and BACKENDS[name].available():
+        backend = BACKENDS[name]
+    else:
+        print(f"[WARNING] Parser {name} tidak tersedia, memakai html.parser")
+        backend = BACKENDS['html.parser']
+
+    _selected[(name, partial)] = backend
+    return backend
@@ -0,0 +1,218 @@
+import csv
+import io
+import os
+import time
+
+from utils.fingerprints import content_hash
+from utils.pipeline import Sink
+from utils.records import record_key
+from utils.settings import env_int
+
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
+
+# Kolom tabel beasiswa (services/database/models.ts) beserta batas panjang VARCHAR-nya
+COLUMNS = (
+    ('judul', 500),
+    ('deskripsi', None),
+    ('deadline', 100),
+    ('link', None),
+    ('kategori', 100),
+    ('sumber', 100),
+    ('record_key', 64),
+    ('content_hash', 64),
+)
+COLUMN_NAMES = ', '.join(name for name, _ in COLUMNS)
+
+CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS {table} (
+      id SERIAL PRIMARY KEY,
+      judul VARCHAR(500) NOT NULL,
+      deskripsi TEXT,
+      deadline VARCHAR(100),
+      link TEXT,
+      kategori VARCHAR(100),
+      sumber VARCHAR(100),
+      record_key VARCHAR(64),
+      content_hash VARCHAR(64),
+      created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+      updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+def database_row(record):
+    """Baris tabel beasiswa dari record, dengan pemetaan field yang sama seperti POST /api/beasiswa"""
+    values = (
+        record.nama_beasiswa or 'Unknown',
+        record.deskripsi or record.persyaratan or '',
+        record.deadline or '',
+        record.link_pendaftaran or '',
+        record.kategori or '',
+        record.website_sumber or '',
+        record_key(record),
+        content_hash(record.to_dict()),
+    )
+    return [value[:limit] if limit else value for value, (_, limit) in zip(values, COLUMNS)]
+
+
+class PostgresSink(Sink):
+    """Muat record langsung ke PostgreSQL dengan COPY FROM STDIN lewat tabel staging
+
+    Record di-COPY bertahap ke tabel staging sementara di dalam satu transaksi; saat close
+    staging digabung ke tabel tujuan dengan upsert per record_key (baris yang isinya sama
+    tidak ditulis ulang) dan baris yang tidak ada di run dihapus, lalu commit. Pembaca tetap
+    melihat data lama sampai commit, dan run yang gagal atau berhenti di tengah di-rollback utuh.
+
+    Baris dengan (kategori, sumber) di keep, yaitu milik sumber yang dilewati filter run,
+    tidak ikut dihapus.
+    """
+
+    name = 'database'
+
+    def __init__(self, dsn, table='beasiswa', batch_size=1000, keep=()):
+        self.dsn = dsn
+        self.table = table
+        self.batch_size = max(1, batch_size)
+        limits = dict(COLUMNS)
+        # Dipotong sesuai panjang kolom agar sama dengan nilai yang tersimpan
+        self.keep = sorted({(kategori[:limits['kategori']], sumber[:limits['sumber']]) for kategori, sumber in keep})
+        self.count = 0
+        self.failed = False
+        self.timings = {'copy': 0.0, 'merge': 0.0}
+        self.changes = {'inserted': 0, 'updated': 0, 'deleted': 0}
+        self._conn = None
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, quoting=csv.QUOTE_ALL)
+        self._pending = 0
+
+    @classmethod
+    def from_env(cls, keep=()):
+        """Buat sink dari DATABASE_URL dan SCRAPER_DB_BATCH"""
+        return cls(os.getenv('DATABASE_URL'), batch_size=env_int('SCRAPER_DB_BATCH', 1000), keep=keep)
+
+    def open(self):
+        if psycopg2 is None:
+            raise RuntimeError("psycopg2 tidak tersedia, install psycopg2-binary untuk SCRAPER_DB_SYNC=postgres")
+        if not self.dsn:
+            raise RuntimeError("DATABASE_URL belum diset")
+
+        self._conn = psycopg2.connect(self.dsn, connect_timeout=10)
+        try:
+            with self._conn.cursor() as cursor:
+                cursor.execute(CREATE_TABLE.format(table=self.table))
+                cursor.execute(f"ALTER TABLE {self.table} ADD COLUMN IF NOT EXISTS record_key VARCHAR(64)")
+                cursor.execute(f"ALTER TABLE {self.table} ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)")
+                cursor.execute(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {self.table}_record_key_idx ON {self.table} (record_key)"
+                )
+            # Commit DDL segera agar lock ALTER TABLE tidak menahan pembaca selama run
+            self._conn.commit()
+            with self._conn.cursor() as cursor:
+                cursor.execute(
+                    f"CREATE TEMP TABLE {self.table}_staging ON COMMIT DROP AS "
+                    f"SELECT {COLUMN_NAMES} FROM {self.table} WITH NO DATA"
+                )
+        except psycopg2.Error:
+            self._conn.close()
+            self._conn = None
+            raise
+
+    def write(self, record, status=None):
+        if self.failed:
+            return
+        self._writer.writerow(database_row(record))
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self._copy()
+
+    def _copy(self):
+        """Kirim baris yang tertampung ke tabel staging dengan satu perintah COPY"""
+        if not self._pending:
+            return
+        started = time.perf_counter()
+        self._buffer.seek(0)
+        try:
+            with self._conn.cursor() as cursor:
+                cursor.copy_expert(
+                    f"COPY {self.table}_staging ({COLUMN_NAMES}) FROM STDIN WITH (FORMAT csv)", self._buffer
+                )
+            self.count += self._pending
+        except psycopg2.Error as e:
+            self.failed = True
+            print(f"[ERROR] COPY ke PostgreSQL gagal setelah {self.count} records: {e}")
+        finally:
+            self._buffer.seek(0)
+            self._buffer.truncate()
+            self._pending = 0
+            self.timings['copy'] += time.perf_counter() - started
+
+    def _merge(self, cursor):
+        """Gabungkan staging ke tabel tujuan (dalam transaksi yang sedang berjalan)"""
+        updates = ', '.join(f"{name} = EXCLUDED.{name}" for name, _ in COLUMNS if name != 'record_key')
+        cursor.execute(f"""
+            INSERT INTO {self.table} ({COLUMN_NAMES})
+            SELECT DISTINCT ON (record_key) {COLUMN_NAMES} FROM {self.table}_staging
+            ON CONFLICT (record_key) DO UPDATE
+            SET {updates}, updated_at = CURRENT_TIMESTAMP
+            WHERE {self.table}.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+            RETURNING (xmax = 0)
+        """)
+        for (inserted,) in cursor.fetchall():
+            self.changes['inserted' if inserted else 'updated'] += 1
+
+        # Baris yang tidak ada di run ini, termasuk baris lama tanpa record_key,
+        # kecuali milik sumber yang dilewati filter
+        cursor.execute(f"""
+            DELETE FROM {self.table} AS target
+            WHERE (target.record_key IS NULL OR NOT EXISTS (
+                SELECT 1 FROM {self.table}_staging AS staging WHERE staging.record_key = target.record_key
+            ))
+            AND NOT EXISTS (
+                SELECT 1 FROM unnest(%s::text[], %s::text[]) AS keep (kategori, sumber)
+                WHERE keep.kategori = target.kategori AND keep.sumber = target.sumber
+            )
+        """, ([kategori for kategori, _ in self.keep], [sumber for _, sumber in self.keep]))
+        self.changes['deleted'] = cursor.rowcount
+
+    def close(self):
+        if self._conn is None:
+            return False
+        try:
+            self._copy()
+            if self.failed or not self.count:
+                self._conn.rollback()
+                return False
+
+            started = time.perf_counter()
+            with self._conn.cursor() as cursor:
+                self._merge(cursor)
+            self._conn.commit()
+            self.timings['merge'] = time.perf_counter() - started
+            print(f"[SUCCESS] {self.count} records dimuat ke PostgreSQL: {self.changes['inserted']} baru, "
+                  f"{self.changes['updated']} berubah, {self.changes['deleted']} dihapus "
+                  f"(COPY {self.timings['copy']:.2f} detik, merge {self.timings['merge']:.2f} detik)")
+            return True
+        except psycopg2.Error as e:
+            self._conn.rollback()
+            print(f"[ERROR] Gagal memuat data ke PostgreSQL, transaksi di-rollback: {e}")
+            return False
+        finally:
+            self._conn.close()
+            self._conn = None
+
+    def abort(self):
+        # Run tidak lengkap: jangan gabungkan staging, tabel tujuan tetap seperti sebelum run
+        if self._conn is None:
+            return False
+        try:
+            self._conn.rollback()
+        except psycopg2.Error:
+            pass
+        finally:
+            self._conn.close()
+            self._conn = None
+        print(f"[WARNING] Run tidak selesai, {self.count + self._pending} records di staging PostgreSQL di-rollback")
+        return False
@@ -0,0 +1,477 @@
+import csv
+import json
+import os
+import queue
+import threading
+import time
+
+from utils.fingerprints import GONE, UNCHANGED, content_hash
+from utils.records import FIELDS, Scholarship, ScholarshipBatch, record_key
+from utils.xlsx_writer import XlsxWriter
+
+_DONE = object()
+
+
+def normalize_record(record):
+    """Normalisasi record: dict lama diubah menjadi Scholarship dan whitespace teks dirapikan"""
+    if isinstance(record, dict):
+        record = Scholarship.from_dict(record)
+    for field in FIELDS:
+        value = getattr(record, field)
+        if isinstance(value, str):
+            setattr(record, field, ' '.join(value.split()))
+    return record
+
+
+def buffered(iterable, maxsize, executor=None):
+    """Jalankan iterable di thread latar dengan antrean terbatas (backpressure)
+
+    Produsen berhenti saat antrean penuh sampai konsumen mengambil item. Exception
+    dari produsen diteruskan ke konsumen. Jika executor diberikan, produsen dijalankan
+    di executor tersebut (batas jumlah produsen aktif), jika tidak di thread baru.
+    Hasilnya harus di-close jika tidak dikonsumsi sampai habis, termasuk yang belum diiterasi.
+    """
+    stream = BufferedStream(maxsize)
+
+    def produce():
+        source = iter(iterable)
+        try:
+            for item in source:
+                if not stream.put((item, None)):
+                    return
+            stream.put((_DONE, None))
+        except BaseException as e:
+            stream.put((_DONE, e))
+        finally:
+            # Hentikan sumber (misal generator scraper) begitu konsumen berhenti
+            close = getattr(source, 'close', None)
+            if close is not None:
+                close()
+
+    if executor is not None:
+        executor.submit(produce)
+    else:
+        threading.Thread(target=produce, name='pipeline-producer', daemon=True).start()
+    return stream
+
+
+class BufferedStream:
+    """Iterator konsumen buffered(); close() menghentikan produsen walau iterasi belum dimulai"""
+
+    def __init__(self, maxsize):
+        self._items = queue.Queue(maxsize=max(1, maxsize))
+        self._stopped = threading.Event()
+
+    def put(self, entry):
+        """Dipanggil produsen: tunggu slot kosong, False jika konsumen sudah berhenti"""
+        while not self._stopped.is_set():
+            try:
+                self._items.put(entry, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._stopped.is_set():
+            raise StopIteration
+        item, error = self._items.get()
+        if item is _DONE:
+            self._stopped.set()
+            if error is not None:
+                raise error
+            raise StopIteration
+        return item
+
+    def close(self):
+        self._stopped.set()
+
+
+class Sink:
+    """Tujuan record dalam pipeline; write dipanggil per record, close sekali di akhir
+
+    Sink biasa menerima semua record hasil run (kecuali yang hilang). Sink dengan
+    changes_only hanya menerima record baru, berubah dan hilang beserta statusnya.
+    Jika run berhenti sebelum selesai, abort dipanggil sebagai pengganti close.
+    """
+
+    name = 'sink'
+    changes_only = False
+
+    def open(self):
+        pass
+
+    def write(self, record, status=None):
+        raise NotImplementedError
+
+    def close(self):
+        """Selesaikan penulisan, kembalikan True jika berhasil"""
+        return True
+
+    def abort(self):
+        """Tutup sink setelah run gagal atau dihentikan; default menyimpan record yang sudah diterima"""
+        return self.close()
+
+
+class FileSink(Sink):
+    """Sink file di folder data/, ditulis bertahap dan di-flush per record"""
+
+    def __init__(self, filename, directory='data'):
+        self.filename = filename
+        self.filepath = os.path.join(directory, filename)
+        self.name = filename
+        self.count = 0
+        self._file = None
+
+    def open(self):
+        os.makedirs(os.path.dirname(self.filepath) or '.', exist_ok=True)
+        self._file = open(self.filepath, 'w', newline='', encoding='utf-8')
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            print(f"Data disimpan ke {self.filepath}")
+        return True
+
+
+class JsonLinesSink(FileSink):
+    """Satu objek JSON per baris; record yang sudah ditulis tetap utuh walau run berhenti di tengah"""
+
+    def write(self, record, status=None):
+        line = json.dumps(dict(zip(FIELDS, record.values())), ensure_ascii=False)
+        self._file.write(line + '\n')
+        self._file.flush()
+        self.count += 1
+
+
+class ChangesSink(JsonLinesSink):
+    """JSON Lines berisi record baru/berubah/hilang dengan field status tambahan"""
+
+    changes_only = True
+
+    def write(self, record, status=None):
+        data = dict(zip(FIELDS, record.values()))
+        data['status'] = status
+        self._file.write(json.dumps(data, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self.count += 1
+
+
+class JsonArraySink(FileSink):
+    """Array JSON dengan format sama seperti save_to_json (indent=2), ditulis bertahap"""
+
+    def write(self, record, status=None):
+        batch = ScholarshipBatch([record])
+        # Tulis satu objek lalu potong pembuka/penutup array agar bisa disambung
+        body = batch.dumps_json(indent=2)[2:-2]
+        self._file.write((',\n' if self.count else '[\n') + body)
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.write('\n]' if self.count else '[]')
+        return super().close()
+
+
+class CsvSink(FileSink):
+    """CSV dengan header FIELDS, ditulis bertahap"""
+
+    def open(self):
+        super().open()
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(FIELDS)
+
+    def write(self, record, status=None):
+        self._writer.writerow(record.values())
+        self._file.flush()
+        self.count += 1
+
+
+class ExcelSink(Sink):
+    """File Excel (.xlsx) yang ditulis bertahap per baris tanpa pandas, memori tidak tumbuh dengan jumlah record"""
+
+    def __init__(self, filename, directory='data'):
+        self.filename = filename
+        self.filepath = os.path.join(directory, filename)
+        self.name = filename
+        self.count = 0
+        self._writer = None
+
+    def open(self):
+        self._writer = XlsxWriter(self.filepath).open()
+        self._writer.write_row(FIELDS, bold=True)
+
+    def write(self, record, status=None):
+        self._writer.write_row(record.values())
+        self.count += 1
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            print(f"Data disimpan ke {self.filepath}")
+        return True
+
+
+class DatabaseSink(Sink):
+    """Upload ke database per chunk; chunk pertama mengganti isi tabel, chunk berikutnya menambah"""
+
+    name = 'database'
+
+    def __init__(self, upload, batch_size=100):
+        # upload(batch, clear_first) -> bool
+        self._upload = upload
+        self.batch_size = max(1, batch_size)
+        self.count = 0
+        self.failed = False
+        self._batch = ScholarshipBatch()
+
+    def write(self, record, status=None):
+        if self.failed:
+            return
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._batch or self.failed:
+            return
+        batch, self._batch = self._batch, ScholarshipBatch()
+        if self._upload(batch, self.count == 0):
+            self.count += len(batch)
+        else:
+            self.failed = True
+            print(f"[ERROR] Upload database berhenti setelah {self.count} records")
+
+    def close(self):
+        self._flush()
+        return self.count > 0 and not self.failed
+
+    def abort(self):
+        # Sisa batch tidak dikirim agar tabel tidak diisi data run yang tidak lengkap
+        print(f"[WARNING] Run tidak selesai, upload database berhenti setelah {self.count} records")
+        return False
+
+
+class DeltaSink(Sink):
+    """Sinkronisasi delta ke database: hanya record baru, berubah dan yang hilang yang dikirim
+
+    Setiap record dibandingkan dengan snapshot sinkronisasi terakhir lewat record_key dan
+    hash konten. Tanpa snapshot (run pertama atau setelah sinkronisasi gagal) seluruh
+    record dikirim sekali sebagai pengganti isi tabel.
+
+    keep berisi pasangan (kategori, website_sumber) milik sumber yang sengaja dilewati
+    filter run (SCRAPER_SOURCES / SCRAPER_SKIP_SOURCES); baris mereka tidak dihapus dan
+    tetap ada di snapshot. Run terfilter tanpa snapshot hanya menambah/mengubah baris.
+    """
+
+    name = 'database'
+
+    def __init__(self, sync, snapshot, keep=()):
+        # sync(inserts, updates, deletes, replace) -> bool
+        self._sync = sync
+        self.snapshot = snapshot
+        self.keep = set(keep)
+        self.count = 0
+        self._hashes = {}
+        self._inserts = []
+        self._updates = []
+
+    def write(self, record, status=None):
+        key = record_key(record)
+        if key in self._hashes:
+            print(f"[WARNING] Record duplikat dilewati untuk database: {record.nama_beasiswa}")
+            return
+        data = record.to_dict()
+        digest = content_hash(data)
+        self._hashes[key] = [digest, record.kategori, record.website_sumber]
+        self.count += 1
+
+        previous = self.snapshot.content_hash(key)
+        if previous == digest and self.snapshot.loaded:
+            return
+        data['record_key'] = key
+        data['content_hash'] = digest
+        (self._updates if previous else self._inserts).append(data)
+
+    def close(self):
+        if not self._hashes:
+            return False
+
+        loaded = self.snapshot.loaded
+        # Tanpa snapshot tabel diganti penuh, kecuali run terfilter yang tidak memuat semua sumber
+        replace = not loaded and not self.keep
+        # Baris sumber yang dilewati filter dibiarkan
+        kept = {key: entry for key, entry in self.snapshot.entries.items()
+                if key not in self._hashes and self.snapshot.scope(key) in self.keep}
+        deletes = [key for key in self.snapshot.entries if key not in self._hashes and key not in kept]
+        if not (replace or self._inserts or self._updates or deletes):
+            print(f"[INFO] Database sudah sinkron, {self.count} records tidak berubah")
+            return True
+
+        if not loaded and self.keep:
+            print("[INFO] Run terfilter tanpa snapshot, baris lama di database tidak dihapus")
+        if self._sync(self._inserts, self._updates, deletes, replace):
+            if loaded or replace:
+                self.snapshot.replace(dict(kept, **self._hashes))
+            return True
+        # Status database tidak pasti, sinkronisasi berikutnya mengganti seluruh isi tabel
+        self.snapshot.invalidate()
+        return False
+
+    def abort(self):
+        # Record yang belum diterima akan terlihat hilang, jadi tidak ada yang dikirim
+        # dan snapshot dibiarkan agar run berikutnya menghitung delta dari kondisi yang sama
+        print("[WARNING] Run tidak selesai, sinkronisasi database dilewati")
+        return False
+
+
+class SinkWorker:
+    """Jalankan satu sink, di thread sendiri dengan antrean terbatas atau langsung di thread pemanggil
+
+    Waktu yang dihabiskan sink untuk write dan close dicatat di elapsed. Sink yang error
+    berhenti menerima record tanpa mengganggu sink lain.
+    """
+
+    def __init__(self, sink, threaded=True, queue_size=256):
+        self.sink = sink
+        self.threaded = threaded
+        self.elapsed = 0.0
+        self.count = 0
+        self.failed = False
+        self.aborted = False
+        self.result = None
+        self._queue = queue.Queue(maxsize=max(1, queue_size))
+        self._thread = None
+
+    def start(self):
+        if self.threaded:
+            self._thread = threading.Thread(target=self._run, name=f'sink-{self.sink.name}', daemon=True)
+            self._thread.start()
+
+    def submit(self, record, status=None):
+        if self.failed:
+            return
+        if self.threaded:
+            self._queue.put((record, status))
+        else:
+            self._write(record, status)
+
+    def _write(self, record, status):
+        if self.failed:
+            return
+        started = time.perf_counter()
+        try:
+            self.sink.write(record, status)
+            self.count += 1
+        except Exception as e:
+            print(f"[ERROR] Sink {self.sink.name} gagal menulis, dinonaktifkan: {e}")
+            self.failed = True
+        self.elapsed += time.perf_counter() - started
+
+    def _close(self):
+        if self.failed:
+            self.result = False
+            return
+        started = time.perf_counter()
+        try:
+            self.result = bool(self.sink.abort() if self.aborted else self.sink.close())
+        except Exception as e:
+            print(f"[ERROR] Sink {self.sink.name} gagal ditutup: {e}")
+            self.result = False
+        self.elapsed += time.perf_counter() - started
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _DONE:
+                break
+            self._write(*item)
+        self._close()
+
+    def stop(self, aborted=False):
+        """Minta sink selesai (abort jika run tidak selesai); di mode thread berjalan di latar sampai join()"""
+        self.aborted = aborted
+        if self.threaded:
+            self._queue.put(_DONE)
+        else:
+            self._close()
+
+    def join(self):
+        if self._thread is not None:
+            self._thread.join()
+        return self.result
+
+
+class Pipeline:
+    """Alirkan record sekali jalan ke beberapa sink; sink yang error dinonaktifkan tanpa menghentikan sink lain
+
+    Dengan parallel setiap sink berjalan di thread sendiri dengan antrean terbatas, sehingga
+    sink lambat (Excel, upload database) tidak menahan sink lain dan close berjalan bersamaan.
+    Waktu per sink tersedia di timings setelah pipeline ditutup. Jika blok with berhenti
+    karena exception (termasuk KeyboardInterrupt), sink ditutup dengan abort.
+    """
+
+    def __init__(self, sinks, normalizers=(normalize_record,), parallel=True, queue_size=256):
+        self.sinks = list(sinks)
+        self.normalizers = list(normalizers)
+        self.parallel = parallel
+        self.queue_size = queue_size
+        self.count = 0
+        self.results = {}
+        self.timings = {}
+        self.counts = {}
+        self._workers = []
+
+    def __enter__(self):
+        for sink in self.sinks:
+            try:
+                sink.open()
+            except Exception as e:
+                print(f"[ERROR] Gagal membuka sink {sink.name}: {e}")
+                self.results[sink.name] = False
+                continue
+            worker = SinkWorker(sink, threaded=self.parallel, queue_size=self.queue_size)
+            worker.start()
+            self._workers.append(worker)
+        return self
+
+    def write(self, record, status=None):
+        """Normalisasi lalu kirim satu record ke sink aktif yang menerima status tersebut"""
+        for normalize in self.normalizers:
+            record = normalize(record)
+        if status != GONE:
+            self.count += 1
+        for worker in self._workers:
+            sink = worker.sink
+            if (status == GONE and not sink.changes_only) or (status == UNCHANGED and sink.changes_only):
+                continue
+            worker.submit(record, status)
+        return record
+
+    def write_all(self, records, with_status=False):
+        """Tulis semua record (atau pasangan (record, status)) dari iterable, kembalikan jumlahnya"""
+        count = 0
+        for item in records:
+            if with_status:
+                self.write(*item)
+            else:
+                self.write(item)
+            count += 1
+        return count
+
+    def __exit__(self, exc_type, exc, tb):
+        # Hentikan semua sink dulu agar close berjalan bersamaan, baru tunggu
+        for worker in self._workers:
+            worker.stop(aborted=exc_type is not None)
+        for worker in self._workers:
+            self.results[worker.sink.name] = bool(worker.join())
+            self.timings[worker.sink.name] = worker.elapsed
+            self.counts[worker.sink.name] = worker.count
+        self._workers = []
+        return False
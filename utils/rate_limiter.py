@@ -0,0 +1,99 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+from utils.settings import env_float, lookup_host, parse_host_map
+
+
+def get_host(url):
+    """Ambil hostname (lowercase) dari URL"""
+    return (urlparse(url).hostname or '').lower()
+
+
+class HostRateLimiter:
+    """Rate limiter per host berbasis jeda minimum antar request ke host yang sama"""
+
+    def __init__(self, default_delay=1.0, jitter=2.0, host_delays=None):
+        self.default_delay = default_delay
+        self.jitter = jitter
+        self.host_delays = {}
+        self._next_slot = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+        self.configure(host_delays or {})
+
+    @classmethod
+    def from_env(cls):
+        """Buat limiter dari SCRAPER_HOST_DELAY, SCRAPER_HOST_JITTER dan SCRAPER_HOST_DELAYS"""
+        return cls(
+            default_delay=env_float('SCRAPER_HOST_DELAY', 1.0),
+            jitter=env_float('SCRAPER_HOST_JITTER', 2.0),
+            host_delays=parse_host_map(os.getenv('SCRAPER_HOST_DELAYS', '')),
+        )
+
+    def configure(self, host_delays):
+        """Set jeda khusus untuk beberapa host sekaligus"""
+        for host, seconds in host_delays.items():
+            self.set_delay(host, seconds)
+
+    def set_delay(self, host, seconds):
+        """Set jeda minimum (detik) untuk satu host, berlaku juga untuk subdomainnya"""
+        if '://' in host:
+            host = get_host(host)
+        with self._lock:
+            self.host_delays[host.lower()] = max(0.0, float(seconds))
+
+    def get_delay(self, host):
+        """Cari jeda untuk host, mencocokkan juga domain induknya"""
+        return lookup_host(self.host_delays, host, self.default_delay)
+
+    def reserve(self, url):
+        """Pesan slot request untuk host dari URL, kembalikan lama tunggu dalam detik"""
+        host = get_host(url)
+        with self._lock:
+            delay = self.get_delay(host)
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            gap = delay + (random.uniform(0, self.jitter) if delay > 0 else 0)
+            self._next_slot[host] = slot + gap
+
+            wait = slot - now
+            stats = self._stats.setdefault(host, {'requests': 0, 'throttled': 0.0})
+            stats['requests'] += 1
+            stats['throttled'] += wait
+        return wait
+
+    def wait(self, url):
+        """Tunggu (blocking) sampai host dari URL boleh di-request lagi"""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def wait_async(self, url):
+        """Versi asyncio dari wait(), tidak memblokir request ke host lain"""
+        wait = self.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self):
+        """Statistik per host: jumlah request dan total waktu throttling"""
+        with self._lock:
+            return {host: dict(values) for host, values in self._stats.items()}
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """Limiter tunggal untuk seluruh proses, dibagi oleh semua scraper"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = HostRateLimiter.from_env()
+        return _rate_limiter
@@ -0,0 +1,159 @@
+import hashlib
+import io
+import json
+from urllib.parse import urlparse
+
+# Urutan field record beasiswa, sama dengan key dict lama dan kolom file ekspor
+FIELDS = (
+    'nama_beasiswa',
+    'kategori',
+    'website_sumber',
+    'deskripsi',
+    'persyaratan',
+    'deadline',
+    'link_pendaftaran',
+    'tanggal_update',
+)
+
+
+def record_key(record):
+    """Identitas stabil record: nama beasiswa (dinormalisasi), kategori dan host sumber
+
+    Tidak bergantung pada isi deskripsi/deadline sehingga record yang isinya berubah
+    tetap dikenali sebagai record yang sama saat sinkronisasi database.
+    """
+    nama = ' '.join(str(record['nama_beasiswa'] or '').lower().split())
+    host = urlparse(record['website_sumber'] or '').netloc.lower()
+    if host.startswith('www.'):
+        host = host[len('www.'):]
+    return hashlib.sha1('\x1f'.join([nama, record['kategori'] or '', host]).encode('utf-8')).hexdigest()
+
+
+class Scholarship:
+    """Satu record beasiswa dengan field tetap (__slots__, tanpa dict per objek)"""
+
+    __slots__ = FIELDS
+
+    def __init__(self, nama_beasiswa, kategori, website_sumber, deskripsi, persyaratan,
+                 deadline, link_pendaftaran, tanggal_update):
+        self.nama_beasiswa = nama_beasiswa
+        self.kategori = kategori
+        self.website_sumber = website_sumber
+        self.deskripsi = deskripsi
+        self.persyaratan = persyaratan
+        self.deadline = deadline
+        self.link_pendaftaran = link_pendaftaran
+        self.tanggal_update = tanggal_update
+
+    @classmethod
+    def from_dict(cls, data):
+        """Buat record dari dict dengan key lama"""
+        return cls(*(data.get(field, '') for field in FIELDS))
+
+    def values(self):
+        """Nilai field sesuai urutan FIELDS"""
+        return tuple(getattr(self, field) for field in FIELDS)
+
+    def to_dict(self):
+        """Dict dengan key lama, untuk kode yang masih membutuhkan dict"""
+        return dict(zip(FIELDS, self.values()))
+
+    def __getitem__(self, field):
+        # Akses gaya dict lama, misal record['nama_beasiswa']
+        if field not in FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __eq__(self, other):
+        return isinstance(other, Scholarship) and self.values() == other.values()
+
+    def __repr__(self):
+        return f"Scholarship({self.nama_beasiswa!r}, {self.kategori!r})"
+
+
+class ScholarshipBatch:
+    """Kumpulan record beasiswa yang disimpan per kolom (satu list per field)
+
+    Exporter membaca kolom/baris langsung tanpa membangun dict per record.
+    """
+
+    def __init__(self, records=None):
+        self.columns = {field: [] for field in FIELDS}
+        if records:
+            self.extend(records)
+
+    def append(self, record):
+        """Tambah satu record (Scholarship atau dict dengan key lama)"""
+        if isinstance(record, dict):
+            for field in FIELDS:
+                self.columns[field].append(record.get(field, ''))
+        else:
+            for field in FIELDS:
+                self.columns[field].append(getattr(record, field))
+
+    def extend(self, records):
+        """Tambah banyak record, atau gabungkan batch lain per kolom"""
+        if isinstance(records, ScholarshipBatch):
+            for field in FIELDS:
+                self.columns[field].extend(records.columns[field])
+            return
+        for record in records:
+            self.append(record)
+
+    def column(self, field):
+        """Semua nilai satu field"""
+        return self.columns[field]
+
+    def rows(self):
+        """Iterasi baris sebagai tuple nilai sesuai urutan FIELDS"""
+        return zip(*(self.columns[field] for field in FIELDS))
+
+    def __len__(self):
+        return len(self.columns[FIELDS[0]])
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __getitem__(self, index):
+        return Scholarship(*(self.columns[field][index] for field in FIELDS))
+
+    def __iter__(self):
+        for row in self.rows():
+            yield Scholarship(*row)
+
+    def to_dicts(self):
+        """List dict dengan key lama, untuk kode yang masih membutuhkan dict"""
+        return [dict(zip(FIELDS, row)) for row in self.rows()]
+
+    def write_json(self, f, indent=2):
+        """Tulis batch sebagai array JSON (format sama dengan json.dump indent=2) langsung dari kolom"""
+        if not len(self):
+            f.write('[]')
+            return
+
+        pad = ' ' * indent
+        keys = [json.dumps(field) for field in FIELDS]
+        f.write('[')
+        for index, row in enumerate(self.rows()):
+            f.write(',\n' if index else '\n')
+            f.write(f"{pad}{{\n")
+            f.write(',\n'.join(
+                f"{pad}{pad}{key}: {json.dumps(value, ensure_ascii=False)}" for key, value in zip(keys, row)
+            ))
+            f.write(f"\n{pad}}}")
+        f.write('\n]')
+
+    def dumps_json(self, indent=None):
+        """Batch sebagai string array JSON; tanpa indent menghasilkan bentuk ringkas untuk dikirim ke API"""
+        if indent:
+            buffer = io.StringIO()
+            self.write_json(buffer, indent=indent)
+            return buffer.getvalue()
+
+        return '[' + ', '.join(self.json_objects()) + ']'
+
+    def json_objects(self):
+        """Iterasi objek JSON ringkas per record, untuk dipotong menjadi chunk upload"""
+        keys = [json.dumps(field) for field in FIELDS]
+        for row in self.rows():
+            yield '{' + ', '.join(f"{key}: {json.dumps(value, ensure_ascii=False)}" for key, value in zip(keys, row)) + '}'
@@ -0,0 +1,147 @@
+import asyncio
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import aiohttp
+import requests
+
+from utils.settings import env_float, env_int
+
+# Status HTTP yang layak dicoba ulang (gangguan sementara di sisi server)
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value):
+    """Parse header Retry-After (detik atau HTTP-date) menjadi detik, None jika tidak valid"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_error(exc):
+    """Tentukan apakah error layak di-retry, kembalikan (retryable, retry_after)"""
+    status = None
+    headers = {}
+    if isinstance(exc, aiohttp.ClientResponseError):
+        status = exc.status
+        headers = exc.headers or {}
+    elif isinstance(exc, requests.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        headers = exc.response.headers
+
+    if status is not None:
+        return status in RETRYABLE_STATUS, parse_retry_after(headers.get('Retry-After'))
+
+    transient = (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError,
+                 requests.ConnectionError, requests.Timeout, ConnectionError)
+    return isinstance(exc, transient), None
+
+
+class RetryPolicy:
+    """Kebijakan retry: jumlah percobaan terbatas, exponential backoff dengan full jitter"""
+
+    def __init__(self, max_attempts=3, base_delay=1.0, max_delay=30.0):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_env(cls):
+        """Buat policy dari SCRAPER_RETRY_ATTEMPTS, SCRAPER_RETRY_BASE_DELAY, SCRAPER_RETRY_MAX_DELAY"""
+        return cls(
+            max_attempts=env_int('SCRAPER_RETRY_ATTEMPTS', 3),
+            base_delay=env_float('SCRAPER_RETRY_BASE_DELAY', 1.0),
+            max_delay=env_float('SCRAPER_RETRY_MAX_DELAY', 30.0),
+        )
+
+    def backoff(self, attempt, retry_after=None):
+        """Lama tunggu sebelum percobaan berikutnya, None jika tidak perlu dicoba lagi"""
+        if attempt >= self.max_attempts:
+            return None
+        if retry_after is not None:
+            # Hormati Retry-After, tapi jangan menunggu melebihi batas
+            return retry_after if retry_after <= self.max_delay else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+
+class CircuitBreaker:
+    """Circuit breaker per host: setelah gagal beruntun, host dilewati sampai run selesai"""
+
+    def __init__(self, failure_threshold=3):
+        self.failure_threshold = max(1, failure_threshold)
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host(self, host):
+        """Data per host (lock harus sudah dipegang)"""
+        return self._hosts.setdefault(host, {
+            'state': 'closed', 'failures': 0, 'retries': 0, 'rejected': 0,
+        })
+
+    def allow(self, host):
+        """Apakah request ke host masih boleh dikirim"""
+        with self._lock:
+            data = self._host(host)
+            if data['state'] == 'open':
+                data['rejected'] += 1
+                return False
+            return True
+
+    def record_success(self, host):
+        """Host merespons normal, reset hitungan gagal beruntun"""
+        with self._lock:
+            data = self._host(host)
+            if data['state'] == 'closed':
+                data['failures'] = 0
+
+    def record_failure(self, host):
+        """Catat kegagalan; buka breaker jika sudah mencapai ambang"""
+        with self._lock:
+            data = self._host(host)
+            data['failures'] += 1
+            if data['state'] == 'closed' and data['failures'] >= self.failure_threshold:
+                data['state'] = 'open'
+                print(f"[WARNING] Circuit breaker terbuka untuk {host}, request berikutnya dilewati")
+
+    def record_retry(self, host):
+        """Catat satu percobaan ulang ke host"""
+        with self._lock:
+            self._host(host)['retries'] += 1
+
+    def stats(self):
+        """Status breaker dan jumlah retry per host"""
+        with self._lock:
+            return {host: dict(data) for host, data in self._hosts.items()}
+
+
+_retry_policy = None
+_circuit_breaker = None
+_lock = threading.Lock()
+
+
+def get_retry_policy():
+    """Retry policy tunggal untuk seluruh proses"""
+    global _retry_policy
+    with _lock:
+        if _retry_policy is None:
+            _retry_policy = RetryPolicy.from_env()
+        return _retry_policy
+
+
+def get_circuit_breaker():
+    """Circuit breaker tunggal untuk seluruh proses (satu run)"""
+    global _circuit_breaker
+    with _lock:
+        if _circuit_breaker is None:
+            _circuit_breaker = CircuitBreaker(env_int('SCRAPER_BREAKER_THRESHOLD', 3))
+        return _circuit_breaker
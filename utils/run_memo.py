@@ -0,0 +1,110 @@
+import threading
+from concurrent.futures import Future
+
+
+class RunMemo:
+    """Memo fetch/parse untuk satu run, dibagi oleh semua scraper
+
+    Setiap URL hanya di-download sekali per run (termasuk yang sedang berjalan),
+    setiap HTML hanya di-parse sekali menjadi BeautifulSoup, dan ekstraksi field
+    dengan aturan yang sama dari halaman yang sama hanya dijalankan sekali.
+    """
+
+    def __init__(self):
+        self.counters = {'fetch_avoided': 0, 'parse_avoided': 0}
+        self._pages = {}
+        self._consumers = {}
+        self._soups = {}
+        self._extracts = {}
+        self._released = 0
+        self._lock = threading.Lock()
+
+    def claim(self, key, consumer=None):
+        """Klaim URL (atau tuple URL + kebutuhan) untuk di-fetch; kembalikan (future, owner)
+
+        Jika owner True, pemanggil wajib mengisi future dengan hasil fetch.
+        Jika False, cukup tunggu future dari konsumen yang sudah mengambilnya.
+        """
+        with self._lock:
+            future = self._pages.get(key)
+            consumers = self._consumers.setdefault(key, set())
+            if future is None:
+                future = Future()
+                self._pages[key] = future
+                consumers.add(consumer)
+                return future, True
+
+            if consumer not in consumers:
+                consumers.add(consumer)
+                self.counters['fetch_avoided'] += 1
+            return future, False
+
+    def release(self, key):
+        """Lepas halaman yang sudah selesai dipakai beserta soup, hasil ekstraksi dan daftar
+        konsumennya agar memori run tidak tumbuh terus; klaim berikutnya untuk key yang sama
+        diambil ulang (dari page store jika masih segar)"""
+        with self._lock:
+            future = self._pages.get(key)
+            if future is not None:
+                if not future.done():
+                    return
+                del self._pages[key]
+                self._released += 1
+                if future.exception() is None and future.result() is not None:
+                    self._soups.pop(future.result(), None)
+            # Konsumen yang mendapat halaman sebelum dilepas bisa mengklaim ekstraksi sesudahnya
+            self._consumers.pop(key, None)
+            self._extracts.pop(key, None)
+
+    def get_soup(self, html, key=None):
+        """Ambil soup yang sudah pernah di-parse dari HTML (dan key) yang sama"""
+        with self._lock:
+            soup = self._soups.get(html, {}).get(key)
+            if soup is not None:
+                self.counters['parse_avoided'] += 1
+            return soup
+
+    def put_soup(self, html, soup, key=None):
+        """Simpan soup hasil parse untuk dipakai konsumen lain"""
+        with self._lock:
+            self._soups.setdefault(html, {}).setdefault(key, soup)
+
+    def claim_extract(self, page, key):
+        """Klaim ekstraksi field dari halaman (key fetch yang sama dengan claim) dengan key
+        misal hash HTML dan aturan; kembalikan (future, owner)
+
+        Jika owner True, pemanggil wajib mengisi future dengan hasil ekstraksi. Jika False,
+        hasil dari pemanggil sebelumnya dipakai ulang dan dihitung sebagai parse yang dihindari.
+        """
+        with self._lock:
+            extracts = self._extracts.setdefault(page, {})
+            future = extracts.get(key)
+            if future is None:
+                future = extracts[key] = Future()
+                return future, True
+            self.counters['parse_avoided'] += 1
+            return future, False
+
+    def stats(self):
+        """Statistik jumlah fetch dan parse duplikat yang dihindari"""
+        with self._lock:
+            stats = dict(self.counters)
+            stats['urls'] = len(self._pages) + self._released
+            return stats
+
+
+_run_memo = RunMemo()
+_run_memo_lock = threading.Lock()
+
+
+def get_run_memo():
+    """Memo untuk run yang sedang berjalan"""
+    return _run_memo
+
+
+def reset_run_memo():
+    """Mulai run baru dengan memo kosong"""
+    global _run_memo
+    with _run_memo_lock:
+        _run_memo = RunMemo()
+        return _run_memo
@@ -0,0 +1,45 @@
+import os
+
+
+def env_int(name, default):
+    """Baca environment variable sebagai int, fallback ke default jika tidak valid"""
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def env_float(name, default):
+    """Baca environment variable sebagai float, fallback ke default jika tidak valid"""
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_host_map(value, cast=float):
+    """Parse string 'host=nilai,host=nilai' menjadi dict {host: nilai}"""
+    result = {}
+    if not value:
+        return result
+
+    for item in value.split(','):
+        if '=' not in item:
+            continue
+        host, raw = item.split('=', 1)
+        host = host.strip().lower()
+        try:
+            result[host] = cast(raw.strip())
+        except ValueError:
+            print(f"[WARNING] Nilai tidak valid untuk host {host}: {raw}")
+    return result
+
+
+def lookup_host(mapping, host, default):
+    """Cari nilai untuk host di mapping, mencocokkan juga domain induknya"""
+    parts = host.split('.')
+    for i in range(len(parts)):
+        candidate = '.'.join(parts[i:])
+        if candidate in mapping:
+            return mapping[candidate]
+    return default
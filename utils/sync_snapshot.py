@@ -0,0 +1,70 @@
+import json
+import os
+import threading
+
+
+class SyncSnapshot:
+    """Isi database menurut sinkronisasi terakhir yang berhasil:
+    record_key -> [hash konten, kategori, website_sumber]
+
+    Dipakai sinkronisasi delta untuk menentukan record mana yang baru, berubah atau
+    harus dihapus tanpa membaca ulang database. Kategori dan sumber menentukan apakah
+    baris milik sumber yang dijalankan. Snapshot hanya diganti setelah API
+    mengonfirmasi sinkronisasi berhasil.
+    """
+
+    def __init__(self, path='data/sync_snapshot.json'):
+        self.path = path
+        self._lock = threading.Lock()
+        self.loaded = False
+        self.entries = self._load()
+
+    @classmethod
+    def from_env(cls):
+        """Buat snapshot dari SCRAPER_SYNC_SNAPSHOT"""
+        return cls(path=os.getenv('SCRAPER_SYNC_SNAPSHOT', 'data/sync_snapshot.json'))
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        self.loaded = isinstance(entries, dict)
+        return entries if self.loaded else {}
+
+    def content_hash(self, key):
+        """Hash konten record saat sinkronisasi terakhir, None jika belum ada"""
+        entry = self.entries.get(key)
+        return entry[0] if entry else None
+
+    def scope(self, key):
+        """Pasangan (kategori, website_sumber) record, None jika belum ada"""
+        entry = self.entries.get(key)
+        return tuple(entry[1:3]) if entry else None
+
+    def replace(self, entries):
+        """Ganti isi snapshot dengan hasil sinkronisasi yang berhasil lalu tulis ke disk"""
+        with self._lock:
+            self.entries = dict(entries)
+            self.loaded = True
+            data = dict(self.entries)
+
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[WARNING] Gagal menyimpan snapshot sinkronisasi: {e}")
+
+    def invalidate(self):
+        """Hapus snapshot agar sinkronisasi berikutnya mengganti seluruh isi tabel"""
+        with self._lock:
+            self.entries = {}
+            self.loaded = False
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,171 @@
+import os
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+# Karakter kontrol yang tidak boleh ada di XML 1.0 (tab, newline dan CR tetap boleh)
+_ILLEGAL_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+# Batas panjang teks satu sel Excel
+MAX_CELL_CHARS = 32767
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+# Dua gaya sel: 0 biasa, 1 tebal untuk header (seperti header to_excel pandas)
+STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+SHEET_END = '</sheetData></worksheet>'
+
+
+def column_letter(index):
+    """Huruf kolom Excel dari indeks 0 (0 -> A, 26 -> AA)"""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _cell(ref, value, style):
+    style_attr = f' s="{style}"' if style else ''
+    if value is None or value == '':
+        return ''
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"{style_attr}><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"{style_attr}><v>{value}</v></c>'
+    text = _ILLEGAL_XML.sub('', str(value))[:MAX_CELL_CHARS]
+    return f'<c r="{ref}" t="inlineStr"{style_attr}><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+
+
+class XlsxWriter:
+    """Penulis file .xlsx satu sheet yang menulis baris langsung ke dalam arsip zip
+
+    Baris di-stream ke entry sheet1.xml begitu ditulis (teks inline, tanpa shared strings),
+    jadi memori tidak bergantung pada jumlah baris dan tidak butuh pandas maupun openpyxl.
+    File ditulis ke path sementara dan baru dipindah ke path tujuan saat close berhasil.
+    """
+
+    def __init__(self, path, sheet_name='Sheet1'):
+        self.path = path
+        self.sheet_name = sheet_name
+        self.rows = 0
+        self._tmp_path = path + '.tmp'
+        self._zip = None
+        self._sheet = None
+        self._refs = []
+
+    def open(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._zip = zipfile.ZipFile(self._tmp_path, 'w', compression=zipfile.ZIP_DEFLATED)
+        self._zip.writestr('[Content_Types].xml', CONTENT_TYPES)
+        self._zip.writestr('_rels/.rels', ROOT_RELS)
+        self._zip.writestr('xl/workbook.xml', WORKBOOK.format(name=escape(self.sheet_name[:31], {'"': '&quot;'})))
+        self._zip.writestr('xl/_rels/workbook.xml.rels', WORKBOOK_RELS)
+        self._zip.writestr('xl/styles.xml', STYLES)
+        # Entry sheet dibuka terakhir dan tetap terbuka selama baris ditulis
+        self._sheet = self._zip.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True)
+        self._sheet.write(SHEET_START.encode('utf-8'))
+        return self
+
+    def write_row(self, values, bold=False):
+        """Tulis satu baris (urutan kolom sesuai values)"""
+        self.rows += 1
+        while len(self._refs) < len(values):
+            self._refs.append(column_letter(len(self._refs)))
+        style = 1 if bold else 0
+        cells = ''.join(_cell(f'{ref}{self.rows}', value, style) for ref, value in zip(self._refs, values))
+        self._sheet.write(f'<row r="{self.rows}">{cells}</row>'.encode('utf-8'))
+
+    def close(self):
+        """Selesaikan arsip dan pindahkan ke path tujuan"""
+        if self._zip is None:
+            return
+        self._sheet.write(SHEET_END.encode('utf-8'))
+        self._sheet.close()
+        self._zip.close()
+        self._zip = None
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """Batalkan penulisan dan hapus file sementara"""
+        if self._zip is not None:
+            try:
+                self._sheet.close()
+                self._zip.close()
+            except (OSError, ValueError):
+                pass
+            self._zip = None
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False